@@ -93,8 +93,8 @@ async def generate_hypotheses(
     if not project.rq.parsed_constructs:
         raise HypothesisGenerationError("No constructs parsed from research question")
     
-    nodes = project.concepts.get("nodes", [])
-    edges = project.concepts.get("edges", [])
+    nodes = project.concept_nodes
+    edges = project.concept_edges
     
     if not nodes:
         logger.warning("No concept nodes found - will generate hypotheses from RQ only")
@@ -198,7 +198,7 @@ def _generate_heuristic_result(
     constructs: List[str] = list(project.rq.parsed_constructs or [])
     
     # Supplement constructs with concept node labels if available
-    concept_nodes = project.concepts.get("nodes", [])
+    concept_nodes = project.concept_nodes
     for node in concept_nodes:
         label = getattr(node, "label", None) or str(node)
         if label and label not in constructs:
@@ -266,8 +266,8 @@ def _build_hypothesis_prompt(project: ProjectState, num_hypotheses: int) -> str:
         Prompt string
     """
     rq = project.rq
-    nodes = project.concepts.get("nodes", [])
-    edges = project.concepts.get("edges", [])
+    nodes = project.concept_nodes
+    edges = project.concept_edges
     
     # Format concept graph summary
     graph_summary = _format_graph_summary(nodes, edges)
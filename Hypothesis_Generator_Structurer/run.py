@@ -229,7 +229,7 @@ def _validate_inputs(project: ProjectState) -> None:
     if not project.rq.parsed_constructs:
         raise Module2Error("No constructs parsed from research question. Run Module 0 first.")
     
-    nodes = project.concepts.get("nodes", [])
+    nodes = project.concept_nodes
     if not nodes:
         logger.warning(
             "No concept nodes found from Module 1. "
@@ -30,6 +30,7 @@ except ImportError:
     logging.warning("LLM tools not available. Concept extraction will be limited.")
 
 from copilot_workflow.config import get_config
+from copilot_workflow.concurrency import gather_bounded
 from Literature_Landscape_Explorer.paper_retrieval import Paper
 
 logger = logging.getLogger(__name__)
@@ -114,17 +115,14 @@ async def extract_concepts_from_papers(
     
     # Batch papers for efficient processing
     batch_size = 5
-    all_concepts = []
+    batches = [papers[i:i+batch_size] for i in range(0, len(papers), batch_size)]
     
-    for i in range(0, len(papers), batch_size):
-        batch = papers[i:i+batch_size]
-        logger.info(f"Processing batch {i//batch_size + 1}/{(len(papers) + batch_size - 1)//batch_size}")
+    async def extract_batch(batch_index: int) -> List[Dict[str, Any]]:
+        logger.info(f"Processing batch {batch_index + 1}/{len(batches)}")
         
         for attempt in range(max_retries):
             try:
-                batch_concepts = await _extract_concepts_batch(batch)
-                all_concepts.extend(batch_concepts)
-                break
+                return await _extract_concepts_batch(batches[batch_index])
             except Exception as e:
                 if attempt < max_retries - 1:
                     wait_time = config.config.retry_delay * (2 ** attempt)
@@ -136,6 +134,11 @@ async def extract_concepts_from_papers(
                 else:
                     logger.error(f"Concept extraction failed for batch after {max_retries} attempts")
                     # Continue with other batches
+        return []
+    
+    # Batches are independent LLM calls; run them with bounded concurrency
+    per_batch = await gather_bounded(extract_batch, range(len(batches)))
+    all_concepts = [concepts for batch in per_batch for concepts in batch]
     
     # Merge and deduplicate concepts
     result = _merge_concepts(all_concepts)
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 
 try:
     import httpx
+    from copilot_workflow.http_client import get_http_client
     HTTPX_AVAILABLE = True
 except ImportError:
     HTTPX_AVAILABLE = False
@@ -145,22 +146,22 @@ async def _fetch_papers_from_openalex(query: str, limit: int) -> List[Paper]:
     
     papers: List[Paper] = []
     
-    # Use async httpx client with concurrent requests for faster fetching
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        tasks = []
-        for page in range(1, total_pages + 1):
-            params = {
-                "search": query,
-                "page": page,
-                "per_page": per_page,
-                "filter": "type:article",  # Only articles
-                "sort": "cited_by_count:desc",  # Most cited first
-                "mailto": "contact@sylph.ai"  # Polite pool
-            }
-            tasks.append(client.get(url, params=params))
-        
-        # Fetch all pages concurrently
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+    # Use the shared pooled client with concurrent requests for faster fetching
+    client = get_http_client()
+    tasks = []
+    for page in range(1, total_pages + 1):
+        params = {
+            "search": query,
+            "page": page,
+            "per_page": per_page,
+            "filter": "type:article",  # Only articles
+            "sort": "cited_by_count:desc",  # Most cited first
+            "mailto": "contact@sylph.ai"  # Polite pool
+        }
+        tasks.append(client.get(url, params=params, timeout=30.0))
+    
+    # Fetch all pages concurrently
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
     
     # Process responses
     for idx, resp in enumerate(responses):
@@ -290,7 +291,10 @@ def _reconstruct_abstract(inverted_index: Dict[str, List[int]]) -> str:
 
 
 def _deduplicate_papers(papers: List[Paper]) -> List[Paper]:
-    """Remove duplicate papers based on title similarity.
+    """Remove duplicate papers based on DOI or normalized title.
+    
+    A paper is a duplicate if its DOI or its title (lowercased,
+    whitespace-collapsed) was already seen; the first occurrence is kept.
     
     Args:
         papers: List of papers potentially with duplicates
@@ -299,15 +303,17 @@ def _deduplicate_papers(papers: List[Paper]) -> List[Paper]:
         List of unique papers
     """
     unique_papers = []
-    seen_titles = set()
+    seen = set()
     
     for paper in papers:
         # Normalize title for comparison
-        normalized_title = paper.title.lower().strip()
+        keys = ["title:" + " ".join(paper.title.lower().split())]
+        if paper.doi:
+            keys.append("doi:" + paper.doi.lower())
         
-        if normalized_title not in seen_titles:
+        if not any(key in seen for key in keys):
             unique_papers.append(paper)
-            seen_titles.add(normalized_title)
+        seen.update(keys)
     
     return unique_papers
 
@@ -11,6 +11,8 @@ from typing import List, Optional, Dict
 from dataclasses import asdict
 
 from copilot_workflow.config import get_config
+from copilot_workflow.batch_llm import BatchLLMError, should_batch, submit_batch
+from copilot_workflow.concurrency import gather_bounded
 from copilot_workflow.schemas import (
     ProjectState,
     ExperimentDesign,
@@ -247,6 +249,91 @@ def _generate_template_stimuli(
     return stimuli[:num_stimuli]
 
 
+def _stimuli_from_data(
+    stimuli_data: List[Dict],
+    condition: Condition,
+    num_stimuli: int
+) -> List[StimulusItem]:
+    """Convert parsed LLM stimulus dicts into StimulusItem objects.
+    
+    Args:
+        stimuli_data: Stimulus dicts from _extract_stimuli_from_response
+        condition: Condition the stimuli were generated for
+        num_stimuli: Maximum number of stimuli to keep
+        
+    Returns:
+        List of StimulusItem objects
+    """
+    stimuli = []
+    for i, stim_dict in enumerate(stimuli_data[:num_stimuli], 1):
+        stimulus = StimulusItem(
+            id=f"stim_{i:03d}",
+            text=stim_dict.get("text", ""),
+            language="en",
+            metadata=StimulusMetadata(assigned_condition=condition.id),
+            variants=_create_stimulus_variants(
+                stim_dict.get("text", ""),
+                condition
+            )
+        )
+        stimuli.append(stimulus)
+    return stimuli
+
+
+async def _generate_with_batch(
+    conditions: List[Condition],
+    num_stimuli: int,
+    style: str,
+    relationship_types: Optional[List[str]]
+) -> Dict[str, List[StimulusItem]]:
+    """Generate stimuli for all conditions through one OpenAI batch job.
+    
+    Args:
+        conditions: Experimental conditions
+        num_stimuli: Number of stimuli per condition
+        style: Generation style
+        relationship_types: Types of relationships
+        
+    Returns:
+        Mapping of condition ID to its stimuli; conditions whose batch
+        result failed or did not parse are omitted
+        
+    Raises:
+        BatchLLMError: If the batch job itself fails
+    """
+    requests = [
+        {
+            "custom_id": condition.id,
+            "body": {
+                "messages": [{
+                    "role": "user",
+                    "content": _create_generation_prompt(
+                        condition, style, num_stimuli, relationship_types
+                    )
+                }],
+                "response_format": {"type": "json_object"}
+            }
+        }
+        for condition in conditions
+    ]
+    results = await submit_batch(requests)
+    
+    by_condition = {condition.id: condition for condition in conditions}
+    generated = {}
+    for result in results:
+        condition = by_condition[result["custom_id"]]
+        if result["error"]:
+            logger.warning(f"  Batch generation failed for {condition.label}: {result['error']}")
+            continue
+        try:
+            stimuli_data = _extract_stimuli_from_response(result["content"])
+        except StimulusGenerationError as e:
+            logger.warning(f"  Batch output unusable for {condition.label}: {e}")
+            continue
+        generated[condition.id] = _stimuli_from_data(stimuli_data, condition, num_stimuli)
+    return generated
+
+
 async def _generate_with_llm(
     condition: Condition,
     num_stimuli: int,
@@ -293,21 +380,7 @@ async def _generate_with_llm(
             
             # Extract stimuli from response
             stimuli_data = _extract_stimuli_from_response(response)
-            
-            # Convert to StimulusItem objects
-            stimuli = []
-            for i, stim_dict in enumerate(stimuli_data[:num_stimuli], 1):
-                stimulus = StimulusItem(
-                    id=f"stim_{i:03d}",
-                    text=stim_dict.get("text", ""),
-                    language="en",
-                    metadata=StimulusMetadata(assigned_condition=condition.id),
-                    variants=_create_stimulus_variants(
-                        stim_dict.get("text", ""),
-                        condition
-                    )
-                )
-                stimuli.append(stimulus)
+            stimuli = _stimuli_from_data(stimuli_data, condition, num_stimuli)
             
             logger.info(f"Successfully generated {len(stimuli)} stimuli with LLM")
             return stimuli
@@ -365,15 +438,32 @@ async def generate_stimuli(
         logger.warning(f"Unknown style '{style}', using 'scenario'")
         style = "scenario"
     
-    all_stimuli = []
+    llm_enabled = use_llm and LLM_AVAILABLE and config.is_provider_available("openai")
+    
+    # Large runs go through the Batch API; conditions it could not serve
+    # fall through to the live path below.
+    batched: Dict[str, List[StimulusItem]] = {}
+    if llm_enabled and should_batch(len(design.conditions) * num_stimuli_per_condition):
+        try:
+            batched = await _generate_with_batch(
+                design.conditions,
+                num_stimuli_per_condition,
+                style,
+                relationship_types
+            )
+            logger.info(f"  ✓ Batch API generated stimuli for {len(batched)} conditions")
+        except BatchLLMError as e:
+            logger.warning(f"  Batch generation failed, using live API: {e}")
     
-    # Generate stimuli for each condition
-    for condition in design.conditions:
+    async def generate_for_condition(condition: Condition) -> List[StimulusItem]:
+        if condition.id in batched:
+            return batched[condition.id]
+        
         logger.info(f"\nGenerating stimuli for condition: {condition.label}")
         
         try:
             # Try LLM-based generation first
-            if use_llm and LLM_AVAILABLE and config.is_provider_available("openai"):
+            if llm_enabled:
                 try:
                     stimuli = await _generate_with_llm(
                         condition,
@@ -381,9 +471,8 @@ async def generate_stimuli(
                         style,
                         relationship_types
                     )
-                    all_stimuli.extend(stimuli)
                     logger.info(f"  ✓ Generated {len(stimuli)} stimuli with LLM")
-                    continue
+                    return stimuli
                     
                 except StimulusGenerationError as e:
                     logger.warning(f"  LLM generation failed: {e}")
@@ -395,13 +484,18 @@ async def generate_stimuli(
                 num_stimuli_per_condition,
                 relationship_types
             )
-            all_stimuli.extend(stimuli)
             logger.info(f"  ✓ Generated {len(stimuli)} stimuli with templates")
+            return stimuli
             
         except Exception as e:
             logger.error(f"  ✗ Failed to generate stimuli for {condition.label}: {e}")
             # Continue with other conditions instead of failing completely
-            continue
+            return []
+    
+    # Conditions are independent, so their LLM calls run concurrently
+    # (bounded by COPILOT_LLM_CONCURRENCY); results keep condition order.
+    per_condition = await gather_bounded(generate_for_condition, design.conditions)
+    all_stimuli = [stimulus for stimuli in per_condition for stimulus in stimuli]
     
     if not all_stimuli:
         raise StimulusGenerationError(
@@ -5,8 +5,8 @@ and provides diagnostic feedback on experimental design quality.
 """
 
 import logging
-import statistics
-from typing import List, Dict, Any
+import math
+from typing import List, Dict, Any, Tuple
 from collections import defaultdict
 
 from copilot_workflow.schemas import (
@@ -17,6 +17,9 @@ from copilot_workflow.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# (n, mean, sd) for one condition/DV cell
+Summary = Tuple[int, float, float]
+
 
 class DiagnosticsEngine:
     """Analyzes simulation results for design quality issues."""
@@ -49,20 +52,21 @@ class DiagnosticsEngine:
         """
         logger.info("Computing simulation diagnostics...")
         
-        # Step 1: Aggregate data by condition
+        # Step 1: Aggregate data by condition and summarize each cell once
         condition_data = self._aggregate_by_condition(participants)
+        summaries = self._summarize_cells(condition_data)
         
         # Step 2: Compute condition means and SDs
-        condition_means = self._compute_condition_stats(condition_data, design)
+        condition_means = self._compute_condition_stats(summaries, design)
         
         # Step 3: Identify dead variables (low variance)
         dead_variables = self._identify_dead_variables(condition_data)
         
         # Step 4: Detect weak effects (small between-condition differences)
-        weak_effects = self._detect_weak_effects(condition_data, condition_means)
+        weak_effects = self._detect_weak_effects(summaries, condition_means)
         
         # Step 5: Compute effect size estimates
-        effect_estimates = self._compute_effect_sizes(condition_data, condition_means)
+        effect_estimates = self._compute_effect_sizes(summaries, condition_means)
         
         logger.info(
             f"Diagnostics complete: {len(dead_variables)} dead vars, "
@@ -98,15 +102,49 @@ class DiagnosticsEngine:
         
         return dict(condition_data)
     
+    @staticmethod
+    def _summarize(scores: List[float]) -> Summary:
+        """Sample size, mean and sample SD of a list of scores (two-pass, fsum)."""
+        n = len(scores)
+        mean = math.fsum(scores) / n
+        if n < 2:
+            return n, mean, 0.0
+        var = math.fsum((x - mean) ** 2 for x in scores) / (n - 1)
+        return n, mean, math.sqrt(var)
+    
+    def _summarize_cells(
+        self,
+        condition_data: Dict[str, Dict[str, List[float]]]
+    ) -> Dict[str, Dict[str, Summary]]:
+        """Summarize every non-empty condition/DV cell.
+        
+        Pairwise comparisons reuse these summaries instead of rescanning
+        the raw scores for every condition pair.
+        
+        Args:
+            condition_data: Aggregated condition data
+            
+        Returns:
+            Nested dict: {condition_id: {dv_name: (n, mean, sd)}}
+        """
+        return {
+            condition_id: {
+                dv_name: self._summarize(scores)
+                for dv_name, scores in dv_scores.items()
+                if scores
+            }
+            for condition_id, dv_scores in condition_data.items()
+        }
+    
     def _compute_condition_stats(
         self,
-        condition_data: Dict[str, Dict[str, List[float]]],
+        summaries: Dict[str, Dict[str, Summary]],
         design: ExperimentDesign
     ) -> Dict[str, Dict[str, Dict[str, float]]]:
         """Compute means and SDs for each condition and DV.
         
         Args:
-            condition_data: Aggregated condition data
+            summaries: Per-cell summaries from _summarize_cells
             design: Experimental design
             
         Returns:
@@ -114,23 +152,13 @@ class DiagnosticsEngine:
         """
         stats = defaultdict(dict)
         
-        # Get all DVs from measures
-        all_dvs = {measure.label for measure in design.measures}
-        
-        for condition_id, dv_scores in condition_data.items():
-            for dv_name, scores in dv_scores.items():
-                if len(scores) > 0:
-                    mean = statistics.mean(scores)
-                    sd = statistics.stdev(scores) if len(scores) > 1 else 0.0
-                    
-                    if dv_name not in stats:
-                        stats[dv_name] = {}
-                    
-                    stats[dv_name][condition_id] = {
-                        "mean": round(mean, 2),
-                        "sd": round(sd, 2),
-                        "n": len(scores)
-                    }
+        for condition_id, dv_summaries in summaries.items():
+            for dv_name, (n, mean, sd) in dv_summaries.items():
+                stats[dv_name][condition_id] = {
+                    "mean": round(mean, 2),
+                    "sd": round(sd, 2),
+                    "n": n
+                }
         
         return dict(stats)
     
@@ -157,7 +185,7 @@ class DiagnosticsEngine:
         
         for dv_name, all_scores in all_dv_scores.items():
             if len(all_scores) > 1:
-                sd = statistics.stdev(all_scores)
+                _, _, sd = self._summarize(all_scores)
                 if sd < self.DEAD_VAR_THRESHOLD:
                     dead_vars.append(dv_name)
                     logger.warning(
@@ -168,13 +196,13 @@ class DiagnosticsEngine:
     
     def _detect_weak_effects(
         self,
-        condition_data: Dict[str, Dict[str, List[float]]],
+        summaries: Dict[str, Dict[str, Summary]],
         condition_means: Dict[str, Dict[str, Dict[str, float]]]
     ) -> List[Dict[str, Any]]:
         """Detect condition comparisons with weak effects.
         
         Args:
-            condition_data: Aggregated condition data
+            summaries: Per-cell summaries from _summarize_cells
             condition_means: Computed condition statistics
             
         Returns:
@@ -191,13 +219,13 @@ class DiagnosticsEngine:
                     cond1 = conditions[i]
                     cond2 = conditions[j]
                     
-                    # Get scores for both conditions
-                    scores1 = condition_data[cond1].get(dv_name, [])
-                    scores2 = condition_data[cond2].get(dv_name, [])
+                    # Get summaries for both conditions
+                    summary1 = summaries[cond1].get(dv_name)
+                    summary2 = summaries[cond2].get(dv_name)
                     
-                    if len(scores1) > 0 and len(scores2) > 0:
+                    if summary1 and summary2:
                         # Compute Cohen's d
-                        cohens_d = self._compute_cohens_d(scores1, scores2)
+                        cohens_d = self._cohens_d(summary1, summary2)
                         
                         if abs(cohens_d) < self.WEAK_EFFECT_THRESHOLD:
                             weak_effects.append({
@@ -216,13 +244,13 @@ class DiagnosticsEngine:
     
     def _compute_effect_sizes(
         self,
-        condition_data: Dict[str, Dict[str, List[float]]],
+        summaries: Dict[str, Dict[str, Summary]],
         condition_means: Dict[str, Dict[str, Dict[str, float]]]
     ) -> List[Dict[str, Any]]:
         """Compute effect size estimates for all condition comparisons.
         
         Args:
-            condition_data: Aggregated condition data
+            summaries: Per-cell summaries from _summarize_cells
             condition_means: Computed condition statistics
             
         Returns:
@@ -238,11 +266,11 @@ class DiagnosticsEngine:
                     cond1 = conditions[i]
                     cond2 = conditions[j]
                     
-                    scores1 = condition_data[cond1].get(dv_name, [])
-                    scores2 = condition_data[cond2].get(dv_name, [])
+                    summary1 = summaries[cond1].get(dv_name)
+                    summary2 = summaries[cond2].get(dv_name)
                     
-                    if len(scores1) > 0 and len(scores2) > 0:
-                        cohens_d = self._compute_cohens_d(scores1, scores2)
+                    if summary1 and summary2:
+                        cohens_d = self._cohens_d(summary1, summary2)
                         
                         # Interpret effect size
                         if abs(cohens_d) < 0.2:
@@ -284,15 +312,17 @@ class DiagnosticsEngine:
         """
         if len(scores1) < 2 or len(scores2) < 2:
             return 0.0
-        
-        mean1 = statistics.mean(scores1)
-        mean2 = statistics.mean(scores2)
-        sd1 = statistics.stdev(scores1)
-        sd2 = statistics.stdev(scores2)
+        return self._cohens_d(self._summarize(scores1), self._summarize(scores2))
+    
+    @staticmethod
+    def _cohens_d(summary1: Summary, summary2: Summary) -> float:
+        """Cohen's d from two precomputed (n, mean, sd) summaries."""
+        n1, mean1, sd1 = summary1
+        n2, mean2, sd2 = summary2
+        if n1 < 2 or n2 < 2:
+            return 0.0
         
         # Pooled standard deviation
-        n1 = len(scores1)
-        n2 = len(scores2)
         pooled_sd = ((n1 - 1) * sd1**2 + (n2 - 1) * sd2**2) / (n1 + n2 - 2)
         pooled_sd = pooled_sd ** 0.5
         
@@ -61,7 +61,7 @@ class ResponseSimulator:
             stimulus=stimulus
         )
         
-        return SyntheticResponse(
+        return SyntheticResponse.fast(
             stimulus_id=stimulus.id,
             condition_id=stimulus.metadata.assigned_condition or "unknown",
             dv_scores=dv_scores,
@@ -1,32 +1,56 @@
 """Pytest configuration for running async tests without external plugins.
 
 The test suite includes many `async def` tests but the repository does not
-depend on pytest-asyncio. This hook executes coroutine tests using
-`asyncio.run`, which keeps the suite lightweight and avoids an extra
-dependency. It also sets a lightweight offline flag so modules can choose
-stubbed data paths during tests.
+depend on pytest-asyncio. This hook executes coroutine tests on a single
+event loop shared across the session, which keeps the suite lightweight and
+avoids an extra dependency. It also sets a lightweight offline flag so
+modules can choose stubbed data paths during tests.
 """
 
 import asyncio
 import inspect
+import logging
 import os
-from typing import Any
+from typing import Any, Optional
 
 
 # Encourage modules to use stubbed/offline paths during tests
 os.environ.setdefault("OFFLINE_MODE", "1")
 
+# Demo node progress logs are noise under test
+logging.getLogger("copilot.bf").setLevel(logging.WARNING)
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _session_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared session loop, recreating it if a test closed it."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
 
 def pytest_pyfunc_call(pyfuncitem: Any) -> bool | None:
     """Allow pytest to execute coroutine tests without extra plugins."""
     test_function = pyfuncitem.obj
     if inspect.iscoroutinefunction(test_function):
-        loop = asyncio.new_event_loop()
+        loop = _session_loop()
+        # Tests may call asyncio.run() or install their own loop, so re-bind
+        # the shared loop as current before every coroutine test.
         asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_function(**pyfuncitem.funcargs))
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
+        # funcargs also holds fixtures requested only by other fixtures
+        argnames = pyfuncitem._fixtureinfo.argnames
+        loop.run_until_complete(test_function(**{arg: pyfuncitem.funcargs[arg] for arg in argnames}))
         return True
     return None
+
+
+def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
+    """Close the shared event loop once the session is over."""
+    global _LOOP
+    if _LOOP is not None and not _LOOP.is_closed():
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.close()
+    _LOOP = None
+    asyncio.set_event_loop(None)
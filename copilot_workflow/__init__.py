@@ -17,7 +17,9 @@ from .schemas import (
     SyntheticParticipant,
     SimulationSummary,
     AuditEntry,
+    AuditLog,
     ProjectState,
+    ProjectStateRT,
 )
 from .workflow import build_workflow, run_workflow
 
@@ -38,7 +40,9 @@ __all__ = [
     "SyntheticParticipant",
     "SimulationSummary",
     "AuditEntry",
+    "AuditLog",
     "ProjectState",
+    "ProjectStateRT",
     "build_workflow",
     "run_workflow",
 ]
@@ -0,0 +1,136 @@
+"""OpenAI Batch API client for large, latency-tolerant LLM fan-outs.
+
+Batch jobs cost about half as much as live requests and are not subject to
+per-request rate limits, but complete asynchronously (up to the 24h
+completion window). Callers route through ``submit_batch`` only when a run
+has at least ``COPILOT_LLM_BATCH_THRESHOLD`` items; the default of 0 keeps
+every stage on the live API.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from copilot_workflow.config import get_config
+from copilot_workflow.http_client import get_http_client
+
+try:
+    from openai import AsyncOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+DEFAULT_BATCH_MODEL = os.getenv("COPILOT_BATCH_MODEL", "gpt-4o-mini")
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchLLMError(Exception):
+    """Raised when a batch job cannot be submitted or does not complete."""
+    pass
+
+
+def should_batch(item_count: int) -> bool:
+    """Whether a fan-out of ``item_count`` items should use the Batch API."""
+    threshold = get_config().config.llm_batch_threshold
+    return OPENAI_AVAILABLE and threshold > 0 and item_count >= threshold
+
+
+async def submit_batch(
+    requests: List[Dict[str, Any]],
+    poll_interval: float = 10.0,
+    timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Run chat-completion requests as one OpenAI batch job.
+
+    Args:
+        requests: Dicts with a unique ``custom_id`` and a chat-completion
+            ``body`` (``model`` defaults to COPILOT_BATCH_MODEL)
+        poll_interval: Seconds between status checks
+        timeout: Give up after this many seconds (None waits for the
+            batch's own completion window)
+
+    Returns:
+        One dict per request, in input order, with ``custom_id``,
+        ``content`` (message text or None) and ``error`` (None on success)
+
+    Raises:
+        BatchLLMError: If the job cannot be created or ends without completing
+    """
+    if not OPENAI_AVAILABLE:
+        raise BatchLLMError("openai package not installed")
+
+    config = get_config()
+    api_key = config.get_provider_key("openai")
+    if not api_key or config.offline:
+        raise BatchLLMError("OpenAI not available for batch requests")
+
+    client = AsyncOpenAI(api_key=api_key, http_client=get_http_client())
+    lines = []
+    for request in requests:
+        body = {"model": DEFAULT_BATCH_MODEL, **request["body"]}
+        lines.append(json.dumps({
+            "custom_id": request["custom_id"],
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": body,
+        }))
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    try:
+        input_file = await client.files.create(
+            file=("copilot_batch.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while batch.status not in _TERMINAL_STATUSES:
+            if deadline is not None and loop.time() >= deadline:
+                await client.batches.cancel(batch.id)
+                raise BatchLLMError(f"Batch {batch.id} timed out after {timeout}s")
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise BatchLLMError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        output = await client.files.content(batch.output_file_id)
+    except BatchLLMError:
+        raise
+    except Exception as e:
+        raise BatchLLMError(f"Batch request failed: {e}") from e
+
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for line in output.text.splitlines():
+        if line.strip():
+            record = json.loads(line)
+            by_id[record["custom_id"]] = record
+
+    results = []
+    for request in requests:
+        custom_id = request["custom_id"]
+        record = by_id.get(custom_id)
+        content, error = None, None
+        if record is None:
+            error = "missing from batch output"
+        elif record.get("error"):
+            error = str(record["error"])
+        else:
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                error = f"HTTP {response.get('status_code')}"
+            else:
+                content = response["body"]["choices"][0]["message"]["content"]
+        results.append({"custom_id": custom_id, "content": content, "error": error})
+    return results
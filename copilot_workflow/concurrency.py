@@ -0,0 +1,45 @@
+"""Bounded concurrency for per-item LLM calls inside stage modules.
+
+Stage modules issue one LLM request per condition or paper batch. Running
+those one after another makes a stage take O(n) round trips; running them
+all at once trips provider rate limits. ``gather_bounded`` keeps at most
+``limit`` requests in flight and starts the next item as soon as a slot
+frees up.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from copilot_workflow.config import get_config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def llm_concurrency() -> int:
+    """Maximum number of in-flight LLM requests (COPILOT_LLM_CONCURRENCY)."""
+    return get_config().config.llm_concurrency
+
+
+async def gather_bounded(
+    process_item: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: Optional[int] = None,
+) -> List[R]:
+    """Await ``process_item`` over ``items`` with at most ``limit`` running.
+
+    Results are returned in input order. The first exception raised by
+    ``process_item`` propagates, so per-item retries and fallbacks belong
+    inside ``process_item`` itself.
+    """
+    items = list(items)
+    results: List[R] = [None] * len(items)  # type: ignore[list-item]
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, item in pending:
+            results[index] = await process_item(item)
+
+    workers = min(limit or llm_concurrency(), len(items))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
@@ -7,6 +7,8 @@ Handles loading and validation of:
 """
 
 import os
+import re
+import mmap
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -14,6 +16,14 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# KEY=VALUE lines of a .env file; comment lines never match because '#' is
+# not a valid key character. Quoted values capture without their quotes.
+_ENV_RE = re.compile(
+    rb'^[ \t]*([A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*'
+    rb'(?:"([^"\r\n]*)"|\'([^\'\r\n]*)\'|([^\r\n]*?))[ \t]*\r?$',
+    re.MULTILINE,
+)
+
 
 @dataclass
 class ProviderConfig:
@@ -33,12 +43,19 @@ class ProviderConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     rate_limit_delay: float = 3.0
+    llm_concurrency: int = 8
+    llm_batch_threshold: int = 0
     
     # Availability flags
     available_providers: List[str] = field(default_factory=list)
     available_tools: List[str] = field(default_factory=list)
 
 
+def _offline_mode() -> bool:
+    """Detect offline/test runs (OFFLINE_MODE=1/true/yes)."""
+    return os.getenv("OFFLINE_MODE", "").lower() in {"1", "true", "yes"}
+
+
 class ConfigurationError(Exception):
     """Raised when required configuration is missing or invalid."""
     pass
@@ -54,6 +71,14 @@ class ConfigManager:
             env_file: Optional path to .env file (default: project root)
         """
         self.config = ProviderConfig()
+        self.offline = _offline_mode()
+        if self.offline:
+            # Offline/test runs use stubbed paths only: no .env discovery, no
+            # key validation, and no real provider reported as available.
+            # Non-secret tuning settings still come from the environment.
+            self.config.available_providers = ["stub"]
+            self._load_settings()
+            return
         self._load_environment(env_file)
         self._validate_configuration()
         self._log_availability()
@@ -85,11 +110,16 @@ class ConfigManager:
         self.config.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         self.config.deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
         
-        # Application settings
+        self._load_settings()
+    
+    def _load_settings(self):
+        """Load application and tuning settings from environment variables."""
         self.config.debug_mode = os.getenv("DEBUG_MODE", "false").lower() == "true"
         self.config.max_retries = int(os.getenv("MAX_RETRIES", "3"))
         self.config.retry_delay = float(os.getenv("RETRY_DELAY", "1.0"))
         self.config.rate_limit_delay = float(os.getenv("RATE_LIMIT_DELAY", "3.0"))
+        self.config.llm_concurrency = max(1, int(os.getenv("COPILOT_LLM_CONCURRENCY", "8")))
+        self.config.llm_batch_threshold = int(os.getenv("COPILOT_LLM_BATCH_THRESHOLD", "0"))
     
     def _load_env_file(self, env_path: Path):
         """Load environment variables from .env file.
@@ -98,24 +128,15 @@ class ConfigManager:
             env_path: Path to .env file
         """
         try:
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                    # Parse KEY=VALUE
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
+            with open(env_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for key, double_quoted, single_quoted, bare in _ENV_RE.findall(mm):
+                        key = key.decode()
+                        value = (double_quoted or single_quoted or bare).decode()
                         # Set in environment (override if empty or missing)
-                        if key not in os.environ or not os.environ.get(key):
+                        if not os.environ.get(key):
                             os.environ[key] = value
         except Exception as e:
             logger.warning(f"Failed to load .env file: {e}")
@@ -178,8 +199,10 @@ class ConfigManager:
             provider: Provider name (gemini, openai, anthropic, deepseek)
             
         Returns:
-            API key if available, None otherwise
+            API key if available, None otherwise ("OFFLINE" in offline mode)
         """
+        if self.offline:
+            return "OFFLINE"
         key_map = {
             "openai": self.config.openai_api_key,
             "gemini": self.config.gemini_api_key,
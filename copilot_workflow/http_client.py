@@ -0,0 +1,50 @@
+"""Shared pooled HTTP client for outbound API calls.
+
+Opening an ``httpx.AsyncClient`` per call pays a TCP + TLS handshake each
+time. ``get_http_client`` hands out one pooled client per event loop (HTTP/2
+when the ``h2`` package is installed) so concurrent requests to the same
+host reuse connections. httpx connections are bound to the loop that
+opened them, so a new loop (e.g. a fresh ``asyncio.run``) gets its own
+client; each client is dropped along with its loop.
+"""
+
+import asyncio
+import logging
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(60.0)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=_LIMITS,
+            timeout=_TIMEOUT,
+            follow_redirects=True,
+        )
+        logger.debug(f"Created shared HTTP client (http2={HTTP2_AVAILABLE})")
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the running loop's shared client (call on application shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
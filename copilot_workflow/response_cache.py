@@ -0,0 +1,91 @@
+"""Small SQLite-backed cache for parsed LLM responses.
+
+Re-running a project (retries, frontend iteration) re-sends identical
+prompts. Caching the parsed result keyed on ``(model, prompt)`` turns those
+repeats into a local lookup with no LLM latency or cost.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".copilot_cache"
+DEFAULT_TTL = 7 * 86400
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Stable key for a model/prompt pair."""
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Key/value store of JSON-serializable values with per-entry expiry."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file (default: COPILOT_CACHE_DIR or .copilot_cache/)
+        """
+        if path is None:
+            cache_dir = Path(os.getenv("COPILOT_CACHE_DIR", DEFAULT_CACHE_DIR))
+            path = cache_dir / "llm_responses.sqlite"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # The connection's context manager only commits; callers wrap it in
+        # contextlib.closing so the file handle is released right away.
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        try:
+            with contextlib.closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, expire: float = DEFAULT_TTL) -> None:
+        """Store a value for ``expire`` seconds."""
+        try:
+            with contextlib.closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + expire),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, model_serializer, model_validator
 
 
 def _uid(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex[:8]}"
 
 
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class ResearchQuestion(BaseModel):
     id: str = Field(default_factory=lambda: _uid("rq"))
     raw_text: str
@@ -24,6 +32,15 @@ class ResearchQuestion(BaseModel):
             raise ValueError("parsed_constructs cannot be empty")
         return self
 
+    @classmethod
+    def fast(cls, raw_text: str, parsed_constructs: List[str]) -> "ResearchQuestion":
+        """Build a question from internally derived constructs without validation.
+
+        Callers must pass a non-empty ``parsed_constructs``; LLM-derived
+        values should go through the validating constructor instead.
+        """
+        return cls.model_construct(raw_text=raw_text, parsed_constructs=parsed_constructs)
+
 
 class ConceptNode(BaseModel):
     id: str
@@ -138,6 +155,22 @@ class SyntheticResponse(BaseModel):
     dv_scores: Dict[str, float]
     open_text: Optional[str] = None
 
+    @classmethod
+    def fast(
+        cls,
+        stimulus_id: str,
+        condition_id: str,
+        dv_scores: Dict[str, float],
+        open_text: Optional[str] = None,
+    ) -> "SyntheticResponse":
+        """Build a response from simulator-generated values without validation."""
+        return cls.model_construct(
+            stimulus_id=stimulus_id,
+            condition_id=condition_id,
+            dv_scores=dv_scores,
+            open_text=open_text,
+        )
+
 
 class SyntheticParticipant(BaseModel):
     id: str = Field(default_factory=lambda: _uid("sp"))
@@ -152,19 +185,102 @@ class SimulationSummary(BaseModel):
     sample_responses: List[str] = Field(default_factory=list)
 
 
-class AuditEntry(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AuditEntry:
     message: str
     level: str = "info"
     location: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    details: Dict[str, Any] = Field(default_factory=dict)
+    timestamp: datetime = field(default_factory=utcnow)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_ns(ts: datetime) -> int:
+    """UTC epoch nanoseconds for ``ts``; naive timestamps are taken as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class AuditLog:
+    """Column-oriented audit trail for the runtime project container.
+
+    Stores one list per ``AuditEntry`` field instead of one object per entry,
+    so appending is a handful of ``list.append`` calls and the log costs a few
+    pointers per entry. Timestamps are kept as UTC epoch nanoseconds (naive
+    inputs are taken as UTC) and read back as aware UTC datetimes. Entries
+    are materialized as ``AuditEntry`` objects only when read.
+    """
+
+    __slots__ = ("levels", "messages", "locations", "details", "ts")
+
+    def __init__(self, entries: Iterable[AuditEntry] = ()):
+        self.levels: List[str] = []
+        self.messages: List[str] = []
+        self.locations: List[Optional[str]] = []
+        self.details: List[Dict[str, Any]] = []
+        self.ts: List[int] = []
+        self.extend(entries)
+
+    def record(
+        self,
+        level: str,
+        message: str,
+        location: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append an entry from its fields without building an ``AuditEntry``."""
+        self.levels.append(level)
+        self.messages.append(message)
+        self.locations.append(location)
+        self.details.append(details or {})
+        self.ts.append(time.time_ns())
+
+    def append(self, entry: AuditEntry) -> None:
+        """List-compatible append used by the stage modules."""
+        self.levels.append(entry.level)
+        self.messages.append(entry.message)
+        self.locations.append(entry.location)
+        self.details.append(entry.details)
+        self.ts.append(_epoch_ns(entry.timestamp))
+
+    def extend(self, entries: Iterable[AuditEntry]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def _entry(self, i: int) -> AuditEntry:
+        return AuditEntry(
+            message=self.messages[i],
+            level=self.levels[i],
+            location=self.locations[i],
+            timestamp=_EPOCH + timedelta(microseconds=self.ts[i] // 1000),
+            details=self.details[i],
+        )
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __iter__(self):
+        return (self._entry(i) for i in range(len(self.levels)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self.levels)))]
+        return self._entry(range(len(self.levels))[index])
+
+    def to_entries(self) -> List[AuditEntry]:
+        """Materialize every entry (used when exporting a ``ProjectState``)."""
+        return [self._entry(i) for i in range(len(self.levels))]
 
 
 class ProjectState(BaseModel):
     project_id: str = Field(default_factory=lambda: _uid("proj"))
     rq: Optional[ResearchQuestion] = None
     papers: List[Any] = Field(default_factory=list)
-    concepts: Dict[str, List[Any]] = Field(default_factory=lambda: {"nodes": [], "edges": []})
+    concept_nodes: List[ConceptNode] = Field(default_factory=list)
+    concept_edges: List[ConceptEdge] = Field(default_factory=list)
     hypotheses: List[Hypothesis] = Field(default_factory=list)
     design: Optional[ExperimentDesign] = None
     stimuli: List[StimulusItem] = Field(default_factory=list)
@@ -172,25 +288,117 @@ class ProjectState(BaseModel):
     audit_log: List[AuditEntry] = Field(default_factory=list)
     checkpoint_id: Optional[str] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def split_concepts(cls, data: Any) -> Any:
+        """Accept the legacy ``concepts={"nodes": [...], "edges": [...]}`` input."""
+        if isinstance(data, dict) and "concepts" in data:
+            data = dict(data)
+            graph = data.pop("concepts") or {}
+            data.setdefault("concept_nodes", graph.get("nodes", []))
+            data.setdefault("concept_edges", graph.get("edges", []))
+        return data
+
+    @model_serializer(mode="wrap")
+    def join_concepts(self, handler: Any) -> Dict[str, Any]:
+        """Serialize the concept graph under the legacy ``concepts`` key."""
+        data = handler(self)
+        if "concept_nodes" not in data and "concept_edges" not in data:
+            return data
+        out: Dict[str, Any] = {}
+        for key, value in data.items():
+            if key in ("concept_nodes", "concept_edges"):
+                if "concepts" not in out:
+                    out["concepts"] = {
+                        "nodes": data.get("concept_nodes", []),
+                        "edges": data.get("concept_edges", []),
+                    }
+            else:
+                out[key] = value
+        return out
 
-def validate_project_state(state: ProjectState) -> List[AuditEntry]:
-    audits: List[AuditEntry] = []
+    @property
+    def concepts(self) -> Mapping[str, List[Any]]:
+        """Read-only ``{"nodes", "edges"}`` view over the concept graph fields."""
+        return MappingProxyType({"nodes": self.concept_nodes, "edges": self.concept_edges})
 
-    def add(level: str, message: str, location: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
-        audits.append(
-            AuditEntry(
-                level=level,
-                message=message,
-                location=location,
-                details=details or {},
-            )
+    @concepts.setter
+    def concepts(self, graph: Mapping[str, List[Any]]) -> None:
+        self.concept_nodes = list(graph.get("nodes", []))
+        self.concept_edges = list(graph.get("edges", []))
+
+
+@dataclass(slots=True, kw_only=True)
+class ProjectStateRT:
+    """Slotted in-memory mirror of ``ProjectState`` used between workflow nodes.
+
+    Stage modules only read and assign attributes, so nodes pass this plain
+    container around and the workflow validates once at the boundaries via
+    ``from_model`` / ``to_model``. Nested models stay pydantic instances.
+    """
+
+    project_id: str = field(default_factory=lambda: _uid("proj"))
+    rq: Optional[ResearchQuestion] = None
+    papers: List[Any] = field(default_factory=list)
+    concept_nodes: List[ConceptNode] = field(default_factory=list)
+    concept_edges: List[ConceptEdge] = field(default_factory=list)
+    hypotheses: List[Hypothesis] = field(default_factory=list)
+    design: Optional[ExperimentDesign] = None
+    stimuli: List[StimulusItem] = field(default_factory=list)
+    simulation: Optional[SimulationSummary] = None
+    audit_log: AuditLog = field(default_factory=AuditLog)
+    checkpoint_id: Optional[str] = None
+
+    @property
+    def concepts(self) -> Mapping[str, List[Any]]:
+        """Read-only ``{"nodes", "edges"}`` view over the concept graph fields."""
+        return MappingProxyType({"nodes": self.concept_nodes, "edges": self.concept_edges})
+
+    @concepts.setter
+    def concepts(self, graph: Mapping[str, List[Any]]) -> None:
+        self.concept_nodes = list(graph.get("nodes", []))
+        self.concept_edges = list(graph.get("edges", []))
+
+    @classmethod
+    def from_model(cls, state: ProjectState) -> "ProjectStateRT":
+        """Shallow-copy a validated ``ProjectState`` into the runtime container."""
+        data = {f.name: getattr(state, f.name) for f in fields(cls)}
+        data["audit_log"] = AuditLog(state.audit_log)
+        return cls(**data)
+
+    def to_model(self) -> ProjectState:
+        """Validate the runtime container back into a ``ProjectState``."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["audit_log"] = self.audit_log.to_entries()
+        return ProjectState.model_validate(data)
+
+
+def _audit_batch(checks: Iterable[Tuple[str, str, Optional[str], Optional[Dict[str, Any]]]]) -> List[AuditEntry]:
+    """Build audit entries for (level, message, location, details) checks sharing one timestamp."""
+    now = utcnow()
+    return [
+        AuditEntry(
+            level=level,
+            message=message,
+            location=location,
+            timestamp=now,
+            details=details or {},
         )
+        for level, message, location, details in checks
+    ]
+
+
+def validate_project_state(state: Union[ProjectState, ProjectStateRT]) -> List[AuditEntry]:
+    checks: List[Tuple[str, str, Optional[str], Optional[Dict[str, Any]]]] = []
+
+    def add(level: str, message: str, location: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+        checks.append((level, message, location, details))
 
     if not state.rq:
         add("error", "Research question missing", "rq")
     if state.rq and not state.rq.parsed_constructs:
         add("error", "Research question parsed_constructs empty", "rq.parsed_constructs")
-    if state.concepts.get("nodes") is not None and len(state.concepts.get("nodes", [])) == 0:
+    if not state.concept_nodes:
         add("warning", "Concept graph has no nodes", "concepts.nodes")
     if state.hypotheses and any((not h.iv or not h.dv) for h in state.hypotheses):
         add("error", "One or more hypotheses missing IV or DV", "hypotheses")
@@ -201,4 +409,4 @@ def validate_project_state(state: ProjectState) -> List[AuditEntry]:
     if state.simulation and state.simulation.dead_vars:
         add("warning", "Simulation flagged dead vars", "simulation.dead_vars", {"dead_vars": state.simulation.dead_vars})
 
-    return audits
+    return _audit_batch(checks)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
+import itertools
+import json
+import os
+import re
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic import ValidationError
@@ -17,9 +23,20 @@ for p in (SPOON_CORE_PATH, SPOON_TOOLKIT_PATH):
 
 from spoon_ai.graph import StateGraph, InMemoryCheckpointer  # type: ignore
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+from copilot_workflow.config import _offline_mode
+from copilot_workflow.response_cache import ResponseCache, cache_key
 from copilot_workflow.schemas import (
     ProjectState,
+    ProjectStateRT,
     ResearchQuestion,
+    ConceptNode,
+    ConceptEdge,
     Hypothesis,
     ExperimentDesign,
     StimulusItem,
@@ -34,22 +51,88 @@ from Stimulus_Factory import run as run_stimuli
 from Synthetic_Participant_Simulator import run as run_simulation
 
 
+# Leading ``` / ```json and trailing ``` around an LLM JSON reply.
+_FENCE_RE = re.compile(r"\A\s*```(?:json)?|```\s*\Z")
+
+
+_checkpoint_counter = itertools.count(1)
+
+
+def _runtime_project(project: Optional[ProjectState | ProjectStateRT]) -> ProjectStateRT:
+    """Move an incoming project onto the slotted runtime container."""
+    if project is None:
+        return ProjectStateRT()
+    if isinstance(project, ProjectState):
+        return ProjectStateRT.from_model(project)
+    return project
+
+
 def _checkpoint() -> str:
-    return datetime.utcnow().isoformat()
+    """Return a unique, monotonically increasing checkpoint id."""
+    return f"ckpt-{next(_checkpoint_counter)}-{time.time_ns()}"
+
+
+_LLM = None
+
+
+def _get_llm():
+    """Return the process-wide LLMManager, constructing it on first use.
+
+    Building an LLMManager re-reads provider configuration and sets up
+    clients, so ingest calls share one instance. Tests can monkeypatch
+    this function to inject a fake manager.
+    """
+    global _LLM
+    if _LLM is None:
+        from spoon_ai.llm import LLMManager, ConfigurationManager
+        _LLM = LLMManager(ConfigurationManager())
+    return _LLM
+
+
+# Strict structured-output schema for ingest_rq construct extraction
+_RQ_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "rq_extract",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "constructs": {"type": "array", "items": {"type": "string"}},
+                "domain": {"type": "string"},
+                "potential_iv": {"type": "array", "items": {"type": "string"}},
+                "potential_dv": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["constructs", "domain", "potential_iv", "potential_dv"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_CACHE: Optional[ResponseCache] = None
+
+
+def _response_cache() -> ResponseCache:
+    """Return the process-wide parsed-response cache, opening it on first use."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ResponseCache()
+    return _CACHE
 
 
 async def ingest_rq(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract research constructs from user query using LLM."""
-    import json
-    from spoon_ai.llm import LLMManager, ConfigurationManager
+    """Extract research constructs from user query using LLM.
+
+    Parsed replies are cached on disk keyed by prompt, so repeated questions
+    skip the LLM. Pass ``no_cache=True`` in the state to force a fresh call;
+    offline runs never touch the cache.
+    """
     from spoon_ai.schema import Message
     
     text = state.get("input") or ""
     if not text.strip():
         raise ValueError("Research question cannot be empty")
     
-    llm = LLMManager(ConfigurationManager())
-    
     # LLM prompt for construct extraction
     prompt = f"""Analyze this research question and extract key psychological/behavioral constructs:
 
@@ -69,22 +152,26 @@ Return ONLY valid JSON in this exact format:
   "potential_dv": ["var1", "var2"]
 }}"""
     
+    use_cache = not state.get("no_cache") and not _offline_mode()
+    key = cache_key("openai", prompt)
+    parsed_data = _response_cache().get(key) if use_cache else None
+    cache_hit = parsed_data is not None
+    
+    llm = None if cache_hit else _get_llm()
+    
     try:
-        response = await llm.chat(
-            [Message(role="user", content=prompt)],
-            provider="openai"
-        )
-        
-        # Parse LLM response (handle markdown code fences)
-        content = response.content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-        parsed_data = json.loads(content)
+        if not cache_hit:
+            response = await llm.chat(
+                [Message(role="user", content=prompt)],
+                provider="openai",
+                response_format=_RQ_RESPONSE_FORMAT
+            )
+            
+            # Strict-schema providers reply with bare JSON; the format spec in
+            # the prompt covers providers that ignore response_format
+            parsed_data = _json_loads(_FENCE_RE.sub("", response.content).strip())
+            if use_cache:
+                _response_cache().set(key, parsed_data)
         
         # Validate required fields
         if not parsed_data.get("constructs"):
@@ -100,12 +187,12 @@ Return ONLY valid JSON in this exact format:
             notes=f"Potential IVs: {parsed_data.get('potential_iv', [])}, DVs: {parsed_data.get('potential_dv', [])}"
         )
         
-        project: ProjectState = state.get("project") or ProjectState()
+        project = _runtime_project(state.get("project"))
         project.rq = rq
         project.checkpoint_id = _checkpoint()
         
         # Add audit log entry
-        project.audit_log.append(AuditEntry(
+        project.audit_log.record(
             level="info",
             message="Research question ingested and analyzed",
             location="ingest_rq",
@@ -115,64 +202,204 @@ Return ONLY valid JSON in this exact format:
                 "potential_variables": {
                     "iv": parsed_data.get("potential_iv", []),
                     "dv": parsed_data.get("potential_dv", [])
+                },
+                "cache": {
+                    "hit": cache_hit,
+                    **(_response_cache().stats() if use_cache else {})
                 }
             }
-        ))
+        )
         
         return {"project": project}
         
     except Exception as e:
         # Fallback to basic parsing if LLM fails
         parsed = [part.strip() for part in text.split()[:3] if part.strip()] or ["construct"]
-        rq = ResearchQuestion(raw_text=text, parsed_constructs=parsed)
-        project: ProjectState = state.get("project") or ProjectState()
+        rq = ResearchQuestion.fast(raw_text=text, parsed_constructs=parsed)
+        project = _runtime_project(state.get("project"))
         project.rq = rq
         project.checkpoint_id = _checkpoint()
-        project.audit_log.append(AuditEntry(
+        project.audit_log.record(
             level="warning",
             message=f"LLM parsing failed, used fallback: {str(e)}",
             location="ingest_rq"
-        ))
+        )
         return {"project": project}
 
 
 async def literature_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project: ProjectStateRT = state["project"]
     project = await run_literature(project)
     project.checkpoint_id = _checkpoint()
     return {"project": project}
 
 
 async def hypotheses_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project: ProjectStateRT = state["project"]
     project = await run_hypotheses(project)
     project.checkpoint_id = _checkpoint()
     return {"project": project}
 
 
+async def literature_hypotheses_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Run literature exploration and an RQ-only hypotheses draft concurrently.
+
+    The draft works on a snapshot of the project, so neither stage sees the
+    other's partial writes. A failed stage does not cancel the other; if the
+    draft fails or comes back empty, hypotheses are regenerated sequentially
+    from the literature-enriched project instead.
+    """
+    project: ProjectStateRT = state["project"]
+    draft_base = copy.deepcopy(project)
+    log_start = len(draft_base.audit_log)
+
+    lit_result, draft_result = await asyncio.gather(
+        run_literature(project),
+        run_hypotheses(draft_base),
+        return_exceptions=True,
+    )
+
+    if isinstance(lit_result, BaseException):
+        project.audit_log.record(
+            level="error",
+            message=f"Literature stage failed: {lit_result}",
+            location="literature_hypotheses",
+        )
+    else:
+        project = lit_result
+
+    if isinstance(draft_result, BaseException) or not draft_result.hypotheses:
+        project = await run_hypotheses(project)
+    else:
+        project.hypotheses = draft_result.hypotheses
+        project.audit_log.extend(draft_result.audit_log[log_start:])
+
+    project.checkpoint_id = _checkpoint()
+    return {"project": project}
+
+
+_COMBINED_PROMPT = """You are planning a behavioral science study.
+
+Research question: {question}
+Key constructs: {constructs}
+
+In one pass:
+1. Map the literature landscape: the main theoretical frameworks, constructs,
+   measures and paradigms relevant to the question, and how they relate.
+2. Draft 3-5 testable hypotheses grounded in that landscape.
+
+Return ONLY valid JSON in this exact format:
+{{
+  "concepts": [{{"label": "name", "type": "theoretical_construct|theoretical_framework|measurement_instrument|experimental_paradigm"}}],
+  "relations": [{{"source": "label A", "target": "label B", "relation_type": "predicts|moderates|mediates|operationalizes"}}],
+  "hypotheses": [{{"text": "...", "iv": ["..."], "dv": ["..."], "mediators": [], "moderators": [], "theoretical_basis": ["..."], "expected_direction": "positive|negative|null"}}]
+}}"""
+
+
+async def run_combined_chain(project: ProjectStateRT) -> ProjectStateRT:
+    """Produce the concept graph and hypotheses with a single LLM call.
+
+    Replaces the literature and hypotheses stages' separate round trips with
+    one prompt. No papers are retrieved, so concept nodes carry no
+    linked_papers. Raises on any LLM or parsing failure so the caller can
+    fall back to the individual stages.
+    """
+    from spoon_ai.schema import Message
+
+    if project.rq is None:
+        raise ValueError("Research question missing; run ingest_rq first")
+
+    prompt = _COMBINED_PROMPT.format(
+        question=project.rq.raw_text,
+        constructs=", ".join(project.rq.parsed_constructs),
+    )
+    response = await _get_llm().chat(
+        [Message(role="user", content=prompt)],
+        provider="openai"
+    )
+    parsed = _json_loads(_FENCE_RE.sub("", response.content).strip())
+
+    nodes = [
+        ConceptNode(
+            id=f"concept_{hashlib.blake2b(c['label'].lower().encode('utf-8'), digest_size=4).hexdigest()}",
+            label=c["label"],
+            type=c.get("type") or "theoretical_construct",
+        )
+        for c in parsed.get("concepts", [])
+        if c.get("label")
+    ]
+    by_label = {node.label: node.id for node in nodes}
+    edges = [
+        ConceptEdge(
+            source=by_label[r["source"]],
+            target=by_label[r["target"]],
+            relation_type=r.get("relation_type") or "relates_to",
+        )
+        for r in parsed.get("relations", [])
+        if r.get("source") in by_label and r.get("target") in by_label
+    ]
+    hypotheses = [Hypothesis(**h) for h in parsed.get("hypotheses", [])]
+    if not hypotheses:
+        raise ValueError("Combined chain returned no hypotheses")
+
+    project.concept_nodes = nodes
+    project.concept_edges = edges
+    project.hypotheses = hypotheses
+    project.audit_log.record(
+        level="info",
+        message="Literature landscape and hypotheses drafted in one LLM call",
+        location="combined_chain",
+        details={
+            "concepts": len(nodes),
+            "edges": len(edges),
+            "hypotheses": len(hypotheses),
+        }
+    )
+    return project
+
+
+async def combined_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Fused literature + hypotheses stage, falling back to the separate stages."""
+    project: ProjectStateRT = state["project"]
+    try:
+        project = await run_combined_chain(copy.deepcopy(project))
+    except Exception as e:
+        project.audit_log.record(
+            level="warning",
+            message=f"Combined chain failed, running stages separately: {e}",
+            location="combined_chain"
+        )
+        project = await run_literature(project)
+        project = await run_hypotheses(project)
+    project.checkpoint_id = _checkpoint()
+    return {"project": project}
+
+
 async def design_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project: ProjectStateRT = state["project"]
     project = await run_design(project)
     project.checkpoint_id = _checkpoint()
     return {"project": project}
 
 
 async def stimuli_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project: ProjectStateRT = state["project"]
     project = await run_stimuli(project)
     project.checkpoint_id = _checkpoint()
     return {"project": project}
 
 
 async def simulate_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project: ProjectStateRT = state["project"]
     project = await run_simulation(project)
     project.checkpoint_id = _checkpoint()
     return {"project": project}
 
 
 async def review_export_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    project: ProjectState = state["project"]
+    project = state["project"]
+    if isinstance(project, ProjectStateRT):
+        project = project.to_model()
     audits = validate_project_state(project)
     if audits:
         project.audit_log.extend(audits)
@@ -186,24 +413,47 @@ async def review_export_node(state: Dict[str, Any]) -> Dict[str, Any]:
     return {"project": project, "validation": audits, "export_bundle": bundle}
 
 
-def build_workflow(checkpointer: Optional[InMemoryCheckpointer] = None) -> StateGraph:
+def build_workflow(
+    checkpointer: Optional[InMemoryCheckpointer] = None,
+    parallel_stages: Optional[bool] = None,
+    fuse_stages: Optional[bool] = None,
+) -> StateGraph:
+    """Build the research copilot graph.
+
+    With ``parallel_stages`` (default: ``COPILOT_PARALLEL_STAGES=1``) the
+    literature and hypotheses stages are fused into one fan-out node, trading
+    literature-grounded hypotheses for lower end-to-end latency.
+
+    With ``fuse_stages`` (default: ``COPILOT_FUSE_STAGES=1``) both stages are
+    replaced by a single LLM call (see ``run_combined_chain``); this takes
+    precedence over ``parallel_stages``. Keep the separate nodes when a
+    human-in-the-loop review is needed between the two stages.
+    """
+    if parallel_stages is None:
+        parallel_stages = os.getenv("COPILOT_PARALLEL_STAGES") == "1"
+    if fuse_stages is None:
+        fuse_stages = os.getenv("COPILOT_FUSE_STAGES") == "1"
+
+    if fuse_stages:
+        front = [("combined", combined_node)]
+    elif parallel_stages:
+        front = [("literature_hypotheses", literature_hypotheses_node)]
+    else:
+        front = [("literature", literature_node), ("hypotheses", hypotheses_node)]
+
     graph = StateGraph(dict, checkpointer=checkpointer)
     graph.add_node("ingest_rq", ingest_rq)
-    graph.add_node("literature", literature_node)
-    graph.add_node("hypotheses", hypotheses_node)
+    for name, node in front:
+        graph.add_node(name, node)
     graph.add_node("design", design_node)
     graph.add_node("stimuli", stimuli_node)
     graph.add_node("simulate", simulate_node)
     graph.add_node("review_export", review_export_node)
 
     graph.set_entry_point("ingest_rq")
-    graph.add_edge("ingest_rq", "literature")
-    graph.add_edge("ingest_rq", "literature")
-    graph.add_edge("literature", "hypotheses")
-    graph.add_edge("hypotheses", "design")
-    graph.add_edge("design", "stimuli")
-    graph.add_edge("stimuli", "simulate")
-    graph.add_edge("simulate", "review_export")
+    chain = ["ingest_rq", *(name for name, _ in front), "design", "stimuli", "simulate", "review_export"]
+    for source, target in zip(chain, chain[1:]):
+        graph.add_edge(source, target)
     return graph
 
 
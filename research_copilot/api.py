@@ -4,12 +4,15 @@ Provides REST API endpoints for managing research projects and executing
 the end-to-end research workflow.
 """
 
+import asyncio
+import json
 import logging
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from spoon_ai.llm import LLMManager, ConfigurationManager
@@ -24,6 +27,12 @@ from models import (
     SimulationResults
 )
 from state_service import ProjectStateService
+
+try:
+    from copilot_workflow.http_client import get_http_client, aclose_http_client
+except ImportError:
+    get_http_client = aclose_http_client = None
+from modules.google_scholar_search import close_session as close_scholar_session
 from modules import (
     LiteratureExplorer,
     HypothesisEngine,
@@ -32,6 +41,18 @@ from modules import (
     SimulationEngine
 )
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:  # pragma: no cover - stdlib fallback
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data)
+
 logger = logging.getLogger(__name__)
 
 # Global state
@@ -43,6 +64,27 @@ stimulus_engine: Optional[StimulusEngine] = None
 simulation_engine: Optional[SimulationEngine] = None
 
 
+def _warm_schemas(app: FastAPI):
+    """Finish model schemas and build the OpenAPI document before serving.
+    
+    Models with unresolved references defer validator construction to
+    first use, and FastAPI generates the OpenAPI schema (every request and
+    response model's JSON schema) on the first /docs or /openapi.json hit.
+    Doing both at startup keeps that cost off the first user request.
+    """
+    for model in (
+        ProjectState,
+        ResearchQuestion,
+        LiteratureLandscape,
+        HypothesisSet,
+        ExperimentDesign,
+        StimulusBank,
+        SimulationResults,
+    ):
+        model.model_rebuild()
+    app.openapi()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -50,8 +92,13 @@ async def lifespan(app: FastAPI):
     
     # Startup
     logger.info("Initializing Research Copilot Backend...")
+    _warm_schemas(app)
     state_service = ProjectStateService()
+    state_service.start_write_behind()
     llm_manager = LLMManager(ConfigurationManager())
+    if get_http_client is not None:
+        # Pooled (HTTP/2) client shared by paper retrieval and batch LLM calls
+        app.state.http = get_http_client()
     
     # Initialize engines
     hypothesis_engine = HypothesisEngine(llm_manager)
@@ -65,13 +112,18 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Research Copilot Backend")
+    await state_service.stop_write_behind()
+    if aclose_http_client is not None:
+        await aclose_http_client()
+    await close_scholar_session()
 
 
 app = FastAPI(
     title="Research Copilot API",
     description="AI-powered research workflow from idea to experimental design",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # CORS middleware for frontend integration
@@ -146,7 +198,7 @@ async def create_project(request: CreateProjectRequest):
         Created project metadata
     """
     try:
-        project = state_service.create_project(
+        project = await state_service.acreate_project(
             name=request.name,
             research_question_text=request.research_question
         )
@@ -171,7 +223,7 @@ async def list_projects():
         List of project metadata
     """
     try:
-        projects = state_service.list_projects()
+        projects = await state_service.alist_projects()
         return [
             ProjectResponse(
                 id=p["id"],
@@ -202,7 +254,10 @@ async def get_project(project_id: str):
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        return project.model_dump(mode='json')
+        # Returned as a response directly to skip FastAPI's jsonable_encoder
+        # pass. Pydantic formats datetimes, as it does for the stored state
+        # and list_projects, so timestamps look the same across endpoints.
+        return DefaultResponse(project.model_dump(mode='json'))
     except HTTPException:
         raise
     except Exception as e:
@@ -237,15 +292,104 @@ async def delete_project(project_id: str):
 # Workflow Module Endpoints
 # ============================================================================
 
+def _concept_payload(concept) -> Dict[str, Any]:
+    """Frontend shape for a knowledge-graph concept."""
+    return {
+        "id": concept.id,
+        "name": concept.label,
+        "type": concept.type,
+        "related_papers": concept.linked_papers,
+        "measures": concept.common_measures
+    }
+
+
+def _relationship_payload(edge) -> Dict[str, Any]:
+    """Frontend shape for a knowledge-graph edge."""
+    return {
+        "source": edge.source,
+        "target": edge.target,
+        "type": edge.relation_type
+    }
+
+
+def _gaps_payload(gaps) -> Dict[str, Any]:
+    """Frontend shape for identified literature gaps."""
+    return {
+        "description": gaps.description,
+        "missing_combinations": gaps.missing_combinations,
+        "unexplored_populations": gaps.unexplored_populations,
+        "methodological_gaps": gaps.methodological_gaps,
+        "theoretical_gaps": gaps.theoretical_gaps
+    }
+
+
+def _literature_response(project_id: str, project: ProjectState, landscape: LiteratureLandscape) -> Dict[str, Any]:
+    """Build the literature-explorer response body expected by the frontend."""
+    return {
+        "status": "success",
+        "message": "Literature exploration completed",
+        "project_id": project_id,
+        "module": "literature-explorer",
+        "data": {
+            "literature_landscape": {
+                "papers": landscape.citations,  # Citations/papers
+                "concepts": [
+                    _concept_payload(concept)
+                    for concept in landscape.knowledge_graph.nodes.values()
+                ],
+                "relationships": [
+                    _relationship_payload(edge)
+                    for edge in landscape.knowledge_graph.edges
+                ],
+                "frameworks": landscape.theoretical_frameworks,
+                "measures": landscape.common_measures,
+                "paradigms": landscape.experimental_paradigms,
+                "gaps": _gaps_payload(landscape.gaps),
+                "summary": landscape.summary
+            },
+            "metadata": {
+                "constructs_found": len(project.research_question.parsed_constructs),
+                "concepts_mapped": len(landscape.knowledge_graph.nodes),
+                "frameworks_identified": len(landscape.theoretical_frameworks),
+                "citations_count": len(landscape.citations)
+            }
+        }
+    }
+
+
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {_json_dumps(data)}\n\n"
+
+
+# Streamed sections whose payload needs reshaping for the frontend
+_STREAM_PAYLOADS = {
+    "concept": _concept_payload,
+    "relationship": _relationship_payload,
+    "gaps": _gaps_payload,
+}
+
+
 @app.post("/api/workflow/literature-explorer", response_model=WorkflowStatusResponse)
-async def run_literature_explorer(request: WorkflowRequest, background_tasks: BackgroundTasks):
+async def run_literature_explorer(
+    request: WorkflowRequest,
+    background_tasks: BackgroundTasks,
+    stream: bool = False,
+    accept: Optional[str] = Header(None)
+):
     """Execute Literature Explorer module.
     
     Extracts concepts, builds knowledge graph, and identifies research gaps.
+    Returns a single JSON response. Clients that pass ``?stream=1`` or send
+    ``Accept: text/event-stream`` instead get Server-Sent Events: one event
+    per section as it is produced, then a ``complete`` event carrying the
+    JSON response body, or an ``error`` event if exploration fails.
     
     Args:
         request: Workflow request with project_id
         background_tasks: FastAPI background tasks
+        stream: Stream sections as Server-Sent Events
+        accept: Accept header; ``text/event-stream`` also selects streaming
         
     Returns:
         Workflow status and results
@@ -258,63 +402,32 @@ async def run_literature_explorer(request: WorkflowRequest, background_tasks: Ba
         if not project.research_question:
             raise HTTPException(status_code=400, detail="Project has no research question")
         
-        # Execute literature exploration
         explorer = LiteratureExplorer(llm_manager)
+        
+        if stream or "text/event-stream" in (accept or ""):
+            async def event_gen():
+                try:
+                    async for event, payload in explorer.explore_stream(project.research_question):
+                        if event == "landscape":
+                            updated = state_service.update_literature_landscape(request.project_id, payload)
+                            yield _sse("complete", _literature_response(request.project_id, updated, payload))
+                        else:
+                            shape = _STREAM_PAYLOADS.get(event)
+                            yield _sse(event, shape(payload) if shape else payload)
+                except Exception as e:
+                    logger.error(f"Literature exploration failed: {e}")
+                    yield _sse("error", {"detail": str(e)})
+            
+            return StreamingResponse(event_gen(), media_type="text/event-stream")
+        
+        # Execute literature exploration
         landscape = await explorer.explore(project.research_question)
         
         # Update project state
         project = state_service.update_literature_landscape(request.project_id, landscape)
         
-        # Convert landscape to JSON-serializable dict
-        landscape_dict = landscape.model_dump(mode='json')
-        
         # Format response to match frontend expectations
-        return {
-            "status": "success",
-            "message": "Literature exploration completed",
-            "project_id": request.project_id,
-            "module": "literature-explorer",
-            "data": {
-                "literature_landscape": {
-                    "papers": landscape.citations,  # Citations/papers
-                    "concepts": [
-                        {
-                            "id": concept.id,
-                            "name": concept.label,
-                            "type": concept.type,
-                            "related_papers": concept.linked_papers,
-                            "measures": concept.common_measures
-                        }
-                        for concept in landscape.knowledge_graph.nodes.values()
-                    ],
-                    "relationships": [
-                        {
-                            "source": edge.source,
-                            "target": edge.target,
-                            "type": edge.relation_type
-                        }
-                        for edge in landscape.knowledge_graph.edges
-                    ],
-                    "frameworks": landscape.theoretical_frameworks,
-                    "measures": landscape.common_measures,
-                    "paradigms": landscape.experimental_paradigms,
-                    "gaps": {
-                        "description": landscape.gaps.description,
-                        "missing_combinations": landscape.gaps.missing_combinations,
-                        "unexplored_populations": landscape.gaps.unexplored_populations,
-                        "methodological_gaps": landscape.gaps.methodological_gaps,
-                        "theoretical_gaps": landscape.gaps.theoretical_gaps
-                    },
-                    "summary": landscape.summary
-                },
-                "metadata": {
-                    "constructs_found": len(project.research_question.parsed_constructs),
-                    "concepts_mapped": len(landscape.knowledge_graph.nodes),
-                    "frameworks_identified": len(landscape.theoretical_frameworks),
-                    "citations_count": len(landscape.citations)
-                }
-            }
-        }
+        return _literature_response(request.project_id, project, landscape)
     except HTTPException:
         raise
     except Exception as e:
@@ -348,7 +461,7 @@ async def run_hypothesis_engine(request: WorkflowRequest):
         # Update project state
         project.hypothesis_set = hypothesis_set
         project.update_status(ProjectStatus.HYPOTHESIS_GENERATION)
-        state_service.save_project(project)
+        state_service.enqueue_save(project)
         
         return WorkflowStatusResponse(
             status="success",
@@ -388,7 +501,7 @@ async def run_design_engine(request: WorkflowRequest):
         # Update project state
         project.experiment_design = design
         project.update_status(ProjectStatus.DESIGN_BUILDING)
-        state_service.save_project(project)
+        state_service.enqueue_save(project)
         
         return WorkflowStatusResponse(
             status="success",
@@ -428,7 +541,7 @@ async def run_stimulus_engine(request: WorkflowRequest):
         # Update project state
         project.stimulus_bank = stimulus_bank
         project.update_status(ProjectStatus.STIMULUS_GENERATION)
-        state_service.save_project(project)
+        state_service.enqueue_save(project)
         
         return WorkflowStatusResponse(
             status="success",
@@ -471,7 +584,7 @@ async def run_simulation_engine(request: WorkflowRequest):
         # Update project state
         project.simulation_results = results
         project.update_status(ProjectStatus.SIMULATION)
-        state_service.save_project(project)
+        state_service.enqueue_save(project)
         
         return WorkflowStatusResponse(
             status="success",
@@ -506,14 +619,25 @@ async def run_full_workflow(request: WorkflowRequest, background_tasks: Backgrou
         # For now, just run literature explorer
         # Full workflow orchestration will be implemented with remaining modules
         explorer = LiteratureExplorer(llm_manager)
-        landscape = await explorer.explore(project.research_question)
-        project = state_service.update_literature_landscape(request.project_id, landscape)
+        
+        # Create every independent stage coroutine first, then await them
+        # together. Awaiting each one inside the loop that creates it (the
+        # async form of submit() followed immediately by result()) would
+        # silently run the stages one after another.
+        stages = {
+            "literature_explorer": explorer.explore(project.research_question),
+        }
+        results = dict(zip(stages, await asyncio.gather(*stages.values())))
+        
+        project = state_service.update_literature_landscape(
+            request.project_id, results["literature_explorer"]
+        )
         
         return WorkflowStatusResponse(
             status="partial",
             message="Full workflow partially implemented - literature exploration completed",
             data={
-                "completed_modules": ["literature_explorer"],
+                "completed_modules": list(results),
                 "pending_modules": ["hypothesis_engine", "design_engine", "stimulus_engine", "simulation_engine"]
             }
         )
@@ -524,6 +648,27 @@ async def run_full_workflow(request: WorkflowRequest, background_tasks: Backgrou
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/projects/{project_id}/flush")
+async def flush_project(project_id: str):
+    """Write any buffered updates for a project to disk.
+    
+    Call before exporting or copying project files, since workflow updates
+    are persisted by a background write-behind task.
+    
+    Args:
+        project_id: Project identifier
+        
+    Returns:
+        Flush confirmation
+    """
+    try:
+        await state_service.flush(project_id)
+        return {"status": "success", "message": f"Project {project_id} flushed"}
+    except Exception as e:
+        logger.error(f"Failed to flush project: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Checkpoint Management
 # ============================================================================
@@ -540,7 +685,7 @@ async def create_checkpoint(project_id: str, checkpoint_name: str):
         Checkpoint confirmation
     """
     try:
-        state_service.create_checkpoint(project_id, checkpoint_name)
+        await state_service.acreate_checkpoint(project_id, checkpoint_name)
         return {
             "status": "success",
             "message": f"Checkpoint '{checkpoint_name}' created"
@@ -611,5 +756,18 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    
+    # "auto" picks uvloop/httptools when installed. Multiple workers need the
+    # import-string form; each worker keeps its own write-behind buffer and
+    # project cache, so raise WEB_CONCURRENCY only for read-heavy deployments.
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",
+        http="auto"
+    )
@@ -136,6 +136,10 @@ async def main():
     return 0
 
 
+def main_sync() -> int:
+    """Synchronous entry point (suitable for a console script)."""
+    return asyncio.run(main())
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
+    sys.exit(main_sync())
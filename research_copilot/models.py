@@ -6,11 +6,16 @@ a consistent interface for project state management.
 """
 
 from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, Field, PrivateAttr
+from datetime import datetime, timezone
 from enum import Enum
 
 
+def utcnow() -> datetime:
+    """Naive UTC timestamp (same values as the deprecated ``datetime.utcnow``)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class ProjectStatus(str, Enum):
     """Project lifecycle status."""
     CREATED = "created"
@@ -29,7 +34,7 @@ class ResearchQuestion(BaseModel):
     parsed_constructs: List[str] = Field(default_factory=list)
     domain: Optional[str] = None
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class Operationalization(BaseModel):
@@ -71,21 +76,92 @@ class KnowledgeGraph(BaseModel):
     nodes: Dict[str, Concept] = Field(default_factory=dict)
     edges: List[ConceptEdge] = Field(default_factory=list)
     
+    # Undirected adjacency index, the ``edges`` list it was built from and
+    # how many of its edges it covers
+    _adj: Dict[str, set] = PrivateAttr(default_factory=dict)
+    _indexed_edges: Optional[list] = PrivateAttr(default=None)
+    _indexed: int = PrivateAttr(default=0)
+    # Casefolded label -> node id, the ``nodes`` dict it was built from and
+    # its node count at the time
+    _labels: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _labeled_nodes: Optional[dict] = PrivateAttr(default=None)
+    _labeled: int = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._index_edges()
+        self._index_labels()
+    
+    def __copy__(self):
+        # A shallow copy would share the index containers with the original;
+        # give the copy its own, rebuilt lazily on first lookup.
+        copied = super().__copy__()
+        copied._reset_indexes()
+        return copied
+    
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None):
+        copied = super().__deepcopy__(memo)
+        copied._reset_indexes()
+        return copied
+    
+    def _reset_indexes(self) -> None:
+        self._adj = {}
+        self._indexed_edges = None
+        self._indexed = 0
+        self._labels = {}
+        self._labeled_nodes = None
+        self._labeled = 0
+    
+    def _labels_stale(self) -> bool:
+        return self._labeled_nodes is not self.nodes or self._labeled != len(self.nodes)
+    
+    def _edges_stale(self) -> bool:
+        return self._indexed_edges is not self.edges or self._indexed != len(self.edges)
+    
+    def _index_labels(self) -> None:
+        """Rebuild the label index from ``nodes``."""
+        self._labels = {c.label.casefold(): c.id for c in self.nodes.values()}
+        self._labeled_nodes = self.nodes
+        self._labeled = len(self.nodes)
+    
+    def _index_edges(self) -> None:
+        """Bring the adjacency index up to date with ``edges``."""
+        if self._indexed_edges is not self.edges or len(self.edges) < self._indexed:
+            # Edges were removed or the list was replaced; rebuild from scratch
+            self._adj = {}
+            self._indexed_edges = self.edges
+            self._indexed = 0
+        adj = self._adj
+        for edge in self.edges[self._indexed:]:
+            adj.setdefault(edge.source, set()).add(edge.target)
+            adj.setdefault(edge.target, set()).add(edge.source)
+        self._indexed = len(self.edges)
+    
     def add_node(self, concept: Concept):
+        replacing = concept.id in self.nodes
         self.nodes[concept.id] = concept
+        if replacing or self._labeled_nodes is not self.nodes or self._labeled != len(self.nodes) - 1:
+            self._index_labels()
+        else:
+            self._labels[concept.label.casefold()] = concept.id
+            self._labeled += 1
+    
+    def find_node_by_label(self, label: str) -> Optional[str]:
+        """Id of the node with this label (case-insensitive), if any."""
+        if self._labels_stale():
+            # nodes dict was modified or replaced directly
+            self._index_labels()
+        return self._labels.get(label.casefold())
     
     def add_edge(self, edge: ConceptEdge):
         self.edges.append(edge)
+        self._index_edges()
     
     def get_connected_concepts(self, concept_id: str) -> List[str]:
         """Get all concepts connected to the given concept."""
-        connected = []
-        for edge in self.edges:
-            if edge.source == concept_id:
-                connected.append(edge.target)
-            elif edge.target == concept_id:
-                connected.append(edge.source)
-        return list(set(connected))
+        if self._edges_stale():
+            # edges list was appended to or replaced directly
+            self._index_edges()
+        return list(self._adj.get(concept_id, ()))
 
 
 class LiteratureGap(BaseModel):
@@ -107,7 +183,7 @@ class LiteratureLandscape(BaseModel):
     gaps: LiteratureGap
     summary: str
     citations: List[Dict[str, str]] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class Hypothesis(BaseModel):
@@ -129,7 +205,7 @@ class HypothesisSet(BaseModel):
     research_question_id: str
     hypotheses: List[Hypothesis]
     variable_glossary: Dict[str, str] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class Condition(BaseModel):
@@ -170,7 +246,7 @@ class ExperimentDesign(BaseModel):
     confound_notes: List[str] = Field(default_factory=list)
     validity_considerations: List[str] = Field(default_factory=list)
     methods_draft: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class StimulusMetadata(BaseModel):
@@ -208,7 +284,7 @@ class StimulusBank(BaseModel):
     stimuli: List[StimulusItem]
     balance_report: Dict[str, Any] = Field(default_factory=dict)
     generation_parameters: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class PersonaProfile(BaseModel):
@@ -253,7 +329,7 @@ class SimulationResults(BaseModel):
     diagnostics: SimulationDiagnostics
     summary_statistics: Dict[str, Any] = Field(default_factory=dict)
     example_responses: List[Dict[str, Any]] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class ProjectState(BaseModel):
@@ -268,10 +344,10 @@ class ProjectState(BaseModel):
     stimulus_bank: Optional[StimulusBank] = None
     simulation_results: Optional[SimulationResults] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     def update_status(self, new_status: ProjectStatus):
         """Update project status and timestamp."""
         self.status = new_status
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
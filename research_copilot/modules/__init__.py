@@ -8,16 +8,29 @@ Provides the five core capability modules for the research copilot:
 5. Simulation Engine - synthetic participant simulation
 """
 
-from .literature_explorer import LiteratureExplorer
-from .hypothesis_engine import HypothesisEngine
-from .design_engine import DesignEngine
-from .stimulus_engine import StimulusEngine
-from .simulation_engine import SimulationEngine
-
-__all__ = [
-    'LiteratureExplorer',
-    'HypothesisEngine',
-    'DesignEngine',
-    'StimulusEngine',
-    'SimulationEngine'
-]
+import importlib
+
+# Engines are imported on first access (PEP 562) so callers only pay for
+# the modules they actually use.
+_MODULES = {
+    'LiteratureExplorer': 'literature_explorer',
+    'HypothesisEngine': 'hypothesis_engine',
+    'DesignEngine': 'design_engine',
+    'StimulusEngine': 'stimulus_engine',
+    'SimulationEngine': 'simulation_engine',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
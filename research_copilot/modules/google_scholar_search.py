@@ -3,16 +3,173 @@
 Fast academic paper search using SerpAPI's Google Scholar endpoint.
 """
 
+import asyncio
+import hashlib
 import os
+import random
+import re
+import time
+import uuid
 import logging
-from typing import List, Dict, Any, Optional
-import aiohttp
+import weakref
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 logger = logging.getLogger(__name__)
 
 # Get API key from environment
 SERPAPI_KEY = os.getenv("SERPAPI_KEY", "6048a0b8e1e187e5301793e9500025d462768faaad666d516c17d0b97bad587e")
 SERPAPI_BASE_URL = "https://serpapi.com/search"
+MAX_RESULTS_PER_REQUEST = 20
+
+# Query-independent request parameters
+_BASE_PARAMS = {"engine": "google_scholar", "api_key": SERPAPI_KEY, "hl": "en"}
+
+# Two-tier result cache (process memory + JSON files) so repeated dev runs
+# don't spend API quota or a network round trip on identical queries.
+CACHE_DIR = Path(os.getenv("SERPAPI_CACHE_DIR", Path(__file__).resolve().parents[2] / ".serpapi_cache"))
+CACHE_TTL = 7 * 86400
+_mem_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# 4-digit publication year (1900-2099)
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Request concurrency cap and retry policy for rate limits / transient errors
+SERPAPI_CONCURRENCY = int(os.getenv("SERPAPI_CONCURRENCY", "8"))
+MAX_ATTEMPTS = 4
+MAX_RETRY_DELAY = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Shared client so concurrent queries multiplex over one HTTP/2 connection
+# (pooled HTTP/1.1 keep-alive without h2). httpx connections are bound to
+# the loop that opened them, so keep one client per loop.
+_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=_LIMITS, timeout=30.0)
+    return client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on in-flight SerpAPI requests for the running loop."""
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = _semaphores[loop] = asyncio.Semaphore(SERPAPI_CONCURRENCY)
+    return sem
+
+
+async def close_session() -> None:
+    """Close the running loop's SerpAPI client (call on application shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _cache_key(query: str, num_results: int, year_from: Optional[int], year_to: Optional[int]) -> str:
+    raw = f"{query}|{year_from}|{year_to}|{num_results}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return cached papers from memory, then disk; None on miss or expiry."""
+    now = time.time()
+    entry = _mem_cache.get(key)
+    if entry is None:
+        try:
+            blob = _json_loads((CACHE_DIR / f"{key}.json").read_bytes())
+            entry = (blob["expires"], blob["papers"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        _mem_cache[key] = entry
+    expires, papers = entry
+    if expires <= now:
+        _mem_cache.pop(key, None)
+        return None
+    return [dict(paper) for paper in papers]
+
+
+def _cache_set(key: str, papers: List[Dict[str, Any]]) -> None:
+    expires = time.time() + CACHE_TTL
+    _mem_cache[key] = (expires, papers)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique temp name so concurrent writers of one key don't clobber each other
+        tmp = CACHE_DIR / f"{key}.json.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp.write_bytes(_json_dumps({"expires": expires, "papers": papers}))
+            os.replace(tmp, CACHE_DIR / f"{key}.json")
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning(f"SerpAPI cache write failed: {e}")
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before the next attempt, honouring a numeric Retry-After."""
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return 0.5 * 2 ** attempt + random.random() * 0.2
+
+
+async def _fetch(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """GET the SerpAPI endpoint with bounded concurrency and retries.
+    
+    Rate limits (429), transient 5xx responses and connection errors are
+    retried with exponential backoff and jitter.
+    
+    Returns:
+        Decoded JSON body, or None if the request ultimately failed
+    """
+    client = _get_client()
+    async with _get_semaphore():
+        for attempt in range(MAX_ATTEMPTS):
+            last = attempt == MAX_ATTEMPTS - 1
+            try:
+                response = await client.get(SERPAPI_BASE_URL, params=params)
+                if response.status_code == 200:
+                    return _json_loads(response.content)
+                if response.status_code not in RETRY_STATUSES or last:
+                    logger.error(f"SerpAPI request failed with status {response.status_code}")
+                    return None
+                delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(f"SerpAPI returned {response.status_code}, retrying in {delay:.1f}s")
+            except httpx.TransportError as e:
+                if last:
+                    raise
+                delay = _retry_delay(attempt, None)
+                logger.warning(f"SerpAPI request error ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    return None
 
 
 async def search_google_scholar(
@@ -32,12 +189,16 @@ async def search_google_scholar(
     Returns:
         List of paper dictionaries with title, authors, year, url, snippet
     """
+    key = _cache_key(query, num_results, year_from, year_to)
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.info(f"Found {len(cached)} cached papers for query: {query}")
+        return cached
+    
     params = {
-        "engine": "google_scholar",
+        **_BASE_PARAMS,
         "q": query,
-        "api_key": SERPAPI_KEY,
-        "num": min(num_results, 20),  # Max 20 per request
-        "hl": "en"
+        "num": num_results if num_results < MAX_RESULTS_PER_REQUEST else MAX_RESULTS_PER_REQUEST
     }
     
     # Add year filters if provided
@@ -47,31 +208,17 @@ async def search_google_scholar(
         params["as_yhi"] = year_to
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(SERPAPI_BASE_URL, params=params) as response:
-                if response.status != 200:
-                    logger.error(f"SerpAPI request failed with status {response.status}")
-                    return []
-                
-                data = await response.json()
-                
-                # Parse organic results
-                papers = []
-                for result in data.get("organic_results", []):
-                    paper = {
-                        "title": result.get("title", ""),
-                        "authors": result.get("publication_info", {}).get("authors", []),
-                        "year": extract_year(result.get("publication_info", {}).get("summary", "")),
-                        "url": result.get("link", ""),
-                        "snippet": result.get("snippet", ""),
-                        "cited_by": result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
-                        "source": "Google Scholar"
-                    }
-                    papers.append(paper)
-                
-                logger.info(f"Found {len(papers)} papers for query: {query}")
-                return papers
-                
+        data = await _fetch(params)
+        if data is None:
+            return []
+        
+        papers = _parse_results(data.get("organic_results", []))
+        
+        logger.info(f"Found {len(papers)} papers for query: {query}")
+        if papers:
+            _cache_set(key, papers)
+        return papers
+        
     except Exception as e:
         logger.error(f"Error searching Google Scholar: {e}")
         return []
@@ -86,15 +233,43 @@ def extract_year(summary: str) -> str:
     Returns:
         Year as string, or empty string if not found
     """
-    import re
     if not summary:
         return ""
     
-    # Look for 4-digit year
-    match = re.search(r'\b(19|20)\d{2}\b', summary)
+    match = _YEAR_RE.search(summary)
     return match.group(0) if match else ""
 
 
+def _paper_key(paper: Dict[str, Any]) -> str:
+    """Normalized identity for deduplication: URL, or title when no URL is present."""
+    url = paper.get("url") or ""
+    if url:
+        return url.split("#")[0].rstrip("/").lower()
+    return "title:" + " ".join(paper.get("title", "").lower().split())
+
+
+def _parse_results(organic_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert SerpAPI organic results to paper dictionaries in a single pass."""
+    year_search = _YEAR_RE.search
+    papers = []
+    append = papers.append
+    for result in organic_results:
+        pub_info = result.get("publication_info") or {}
+        summary = pub_info.get("summary")
+        match = year_search(summary) if summary else None
+        cited_by = (result.get("inline_links") or {}).get("cited_by") or {}
+        append({
+            "title": result.get("title", ""),
+            "authors": pub_info.get("authors", []),
+            "year": match.group(0) if match else "",
+            "url": result.get("link", ""),
+            "snippet": result.get("snippet", ""),
+            "cited_by": cited_by.get("total", 0),
+            "source": "Google Scholar"
+        })
+    return papers
+
+
 async def search_multiple_queries(
     queries: List[str],
     papers_per_query: int = 10
@@ -110,13 +285,28 @@ async def search_multiple_queries(
     """
     all_papers = []
     all_citations = []
+    seen = set()
+    
+    # Dispatch all queries concurrently; wall time is the slowest round trip
+    results = await asyncio.gather(
+        *(search_google_scholar(q, num_results=papers_per_query) for q in queries),
+        return_exceptions=True
+    )
     
-    for query in queries:
-        papers = await search_google_scholar(query, num_results=papers_per_query)
-        all_papers.extend(papers)
+    for query, papers in zip(queries, results):
+        if isinstance(papers, Exception):
+            logger.error(f"Error searching Google Scholar for query {query}: {papers}")
+            continue
         
-        # Convert to citation format
         for paper in papers:
+            # Queries in a sweep often overlap; keep the first hit per paper
+            key = _paper_key(paper)
+            if key in seen:
+                continue
+            seen.add(key)
+            all_papers.append(paper)
+            
+            # Convert to citation format
             citation = {
                 "title": paper["title"],
                 "authors": ", ".join(paper["authors"]) if isinstance(paper["authors"], list) else paper["authors"],
@@ -4,52 +4,425 @@ Extracts concepts from research questions, searches academic literature,
 builds knowledge graphs, and identifies research gaps.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-import uuid
-from typing import Dict, Any, List
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+try:
+    import json5
+except ImportError:  # optional lenient parser for malformed LLM JSON
+    json5 = None
 
 from spoon_ai.llm import LLMManager
 from spoon_ai.schema import Message
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models import (
-    ResearchQuestion,
-    Concept,
-    ConceptEdge,
-    KnowledgeGraph,
-    LiteratureGap,
-    LiteratureLandscape,
-    Operationalization
-)
+# Relative when loaded as research_copilot.modules.*; api.py runs from inside
+# research_copilot/, where modules/ is top level and models is a sibling.
+try:
+    from ..models import (
+        ResearchQuestion,
+        Concept,
+        ConceptEdge,
+        KnowledgeGraph,
+        LiteratureGap,
+        LiteratureLandscape,
+        Operationalization
+    )
+except ImportError:
+    from models import (
+        ResearchQuestion,
+        Concept,
+        ConceptEdge,
+        KnowledgeGraph,
+        LiteratureGap,
+        LiteratureLandscape,
+        Operationalization
+    )
+
+
+# OpenAlex paper retrieval (free, no API key needed), imported on first search
+_PAPER_RETRIEVAL_DIR = Path(__file__).parent.parent.parent / 'Literature_Landscape_Explorer'
+_retrieve_papers = None  # retrieve_papers once loaded, False if unavailable
 
 
-# Import OpenAlex paper retrieval (free, no API key needed)
+def _get_retrieve_papers():
+    """Import ``paper_retrieval.retrieve_papers`` once; None if unavailable."""
+    global _retrieve_papers
+    if _retrieve_papers is None:
+        try:
+            if str(_PAPER_RETRIEVAL_DIR) not in sys.path:
+                sys.path.insert(0, str(_PAPER_RETRIEVAL_DIR))
+            from paper_retrieval import retrieve_papers
+            _retrieve_papers = retrieve_papers
+        except ImportError:
+            logger.debug("OpenAlex paper retrieval not available.")
+            _retrieve_papers = False
+    return _retrieve_papers or None
+
+
+# Shared on-disk LLM response cache (optional: needs copilot_workflow importable)
 try:
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'Literature_Landscape_Explorer'))
-    from paper_retrieval import retrieve_papers
-    SEARCH_AVAILABLE = True
+    from copilot_workflow.config import _offline_mode
+    from copilot_workflow.response_cache import ResponseCache, cache_key
 except ImportError:
-    SEARCH_AVAILABLE = False
-    logging.debug("OpenAlex paper retrieval not available.")
+    ResponseCache = cache_key = _offline_mode = None
 logger = logging.getLogger(__name__)
 
 
+# Budget for the paper snippets included in analysis prompts. Estimated at
+# ~4 characters per token, which is close enough across providers' tokenizers.
+PAPERS_TOKEN_BUDGET = 2000
+CHARS_PER_TOKEN = 4
+ABSTRACT_CHARS = 600
+# Below this much paper text, framework/paradigm answers would be guesses;
+# the generic defaults are used instead of asking the LLM
+MIN_PAPERS_CHARS = 200
+
+# Static instructions go in the system message, ahead of the per-call data,
+# so providers can serve the repeated prefix from their prompt cache
+# (automatic prefix caching on OpenAI, cache_control on Anthropic).
+CONSTRUCTS_SYSTEM_PROMPT = """Analyze the research question and extract the key theoretical constructs, variables, and concepts.
+
+Provide a list of 3-7 key constructs that are central to this research question.
+Focus on:
+- Psychological/behavioral constructs (e.g., attachment, emotion regulation)
+- Outcome variables (e.g., well-being, performance)
+- Populations or contexts if specific
+
+Return as a JSON array of strings."""
+
+CONCEPTS_SYSTEM_PROMPT = """Analyze the research question and extract the key theoretical constructs, variables, and concepts, then identify the key theoretical relationships between them.
+
+Provide 3-7 key constructs that are central to this research question.
+Focus on:
+- Psychological/behavioral constructs (e.g., attachment, emotion regulation)
+- Outcome variables (e.g., well-being, performance)
+- Populations or contexts if specific
+
+For each relationship between two of those constructs, specify:
+- source construct
+- target construct
+- relationship type (predicts, associated_with, moderates, mediates)
+Only include well-established theoretical relationships.
+
+Return a single JSON object with fields 'constructs' (array of strings) and 'relationships' (array of objects with 'source', 'target', 'relation_type' fields, using the construct names exactly as listed)."""
+
+RELATIONSHIPS_SYSTEM_PROMPT = """Given a list of psychological/research constructs, identify the key theoretical relationships between them.
+
+For each relationship, specify:
+- source construct
+- target construct  
+- relationship type (predicts, associated_with, moderates, mediates)
+
+Return as JSON array of objects with 'source', 'target', 'relation_type' fields.
+Only include well-established theoretical relationships."""
+
+FRAMEWORKS_SYSTEM_PROMPT = """Based on the research papers provided, identify 2-4 major theoretical frameworks that are commonly used.
+
+For each framework, provide:
+- name
+- brief description (1-2 sentences)
+
+Return as JSON array of objects with 'name' and 'description' fields."""
+
+MEASURES_SYSTEM_PROMPT = """For the psychological construct provided, list 2-4 commonly used measurement scales or instruments.
+
+Return as a JSON array of scale names.
+Example for anxiety: ["STAI", "GAD-7"]"""
+
+# Cap on concurrent per-construct measure requests (provider rate limits)
+MEASURES_CONCURRENCY = 5
+
+PARADIGMS_SYSTEM_PROMPT = """Based on the papers provided, identify 2-3 common experimental paradigms or tasks used in this research area.
+
+For each paradigm, provide:
+- name
+- description (what participants do)
+
+Return as JSON array of objects with 'name' and 'description' fields."""
+
+GAPS_SYSTEM_PROMPT = """Analyze the research landscape and identify key gaps.
+
+Identify gaps in:
+1. Missing variable combinations (which constructs haven't been studied together?)
+2. Unexplored populations (age groups, cultures, contexts not well studied)
+3. Methodological gaps (needed approaches, designs, measures)
+4. Theoretical gaps (unanswered questions, mechanisms)
+
+Return as JSON with fields: 'description', 'missing_combinations', 'unexplored_populations', 'methodological_gaps', 'theoretical_gaps'.
+Each field except 'description' should be an array of strings."""
+
+ANALYSIS_SYSTEM_PROMPT = """Analyze the research landscape for the research question, constructs and papers provided.
+
+Return a single JSON object with exactly these fields:
+- "frameworks": 2-4 major theoretical frameworks commonly used in the papers, as an array of objects with 'name' and 'description' (1-2 sentences) fields
+- "measures": for each construct, 2-4 commonly used measurement scales or instruments, as an object whose keys are constructs and values are arrays of scale names (e.g. {"anxiety": ["STAI", "GAD-7"]})
+- "paradigms": 2-3 common experimental paradigms or tasks in this research area, as an array of objects with 'name' and 'description' (what participants do) fields
+- "gaps": an object with fields 'description', 'missing_combinations', 'unexplored_populations', 'methodological_gaps', 'theoretical_gaps'; each field except 'description' is an array of strings covering missing variable combinations, unexplored populations (age groups, cultures, contexts), needed methodological approaches, and unanswered theoretical questions or mechanisms
+
+Return only the JSON object."""
+
+SUMMARY_SYSTEM_PROMPT = """Create a concise summary (3-4 paragraphs) of the literature landscape for the research question provided.
+
+Write a clear, informative summary that:
+1. Describes the current state of research
+2. Highlights key theoretical perspectives
+3. Notes common methodological approaches
+4. Emphasizes the identified gaps
+
+Use professional academic tone."""
+
+
+def _json_schema_format(name: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Strict structured-output ``response_format`` for an object schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+_STRINGS = {"type": "array", "items": {"type": "string"}}
+_NAMED_ITEMS = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "description": {"type": "string"}},
+        "required": ["name", "description"],
+        "additionalProperties": False,
+    },
+}
+
+# Structured-output schemas, used when the explorer is given a provider that
+# supports response_format. Strict mode needs fixed keys, so measures come
+# back as a list of {construct, scales} and are folded into a dict.
+CONSTRUCTS_FORMAT = _json_schema_format("constructs", {"constructs": _STRINGS})
+_RELATIONSHIPS = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "source": {"type": "string"},
+            "target": {"type": "string"},
+            "relation_type": {
+                "type": "string",
+                "enum": ["predicts", "associated_with", "moderates", "mediates"],
+            },
+        },
+        "required": ["source", "target", "relation_type"],
+        "additionalProperties": False,
+    },
+}
+RELATIONSHIPS_FORMAT = _json_schema_format("relationships", {"relationships": _RELATIONSHIPS})
+CONCEPTS_FORMAT = _json_schema_format("concepts", {
+    "constructs": _STRINGS,
+    "relationships": _RELATIONSHIPS,
+})
+_GAPS = {
+    "type": "object",
+    "properties": {
+        "description": {"type": "string"},
+        "missing_combinations": _STRINGS,
+        "unexplored_populations": _STRINGS,
+        "methodological_gaps": _STRINGS,
+        "theoretical_gaps": _STRINGS,
+    },
+    "required": [
+        "description", "missing_combinations", "unexplored_populations",
+        "methodological_gaps", "theoretical_gaps",
+    ],
+    "additionalProperties": False,
+}
+ANALYSIS_FORMAT = _json_schema_format("literature_analysis", {
+    "frameworks": _NAMED_ITEMS,
+    "measures": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {"construct": {"type": "string"}, "scales": _STRINGS},
+            "required": ["construct", "scales"],
+            "additionalProperties": False,
+        },
+    },
+    "paradigms": _NAMED_ITEMS,
+    "gaps": _GAPS,
+})
+# Formats for the separate calls the fused analysis falls back to
+FRAMEWORKS_FORMAT = _json_schema_format("frameworks", {"frameworks": _NAMED_ITEMS})
+MEASURES_FORMAT = _json_schema_format("measures", {"scales": _STRINGS})
+PARADIGMS_FORMAT = _json_schema_format("paradigms", {"paradigms": _NAMED_ITEMS})
+GAPS_FORMAT = _json_schema_format("gaps", _GAPS["properties"])
+
+
+def _messages(system_prompt: str, user_prompt: str) -> List[Message]:
+    """Static system prefix followed by the per-call user content."""
+    return [
+        Message(role="system", content=system_prompt),
+        Message(role="user", content=user_prompt),
+    ]
+
+
+# One bullet/numbered/plain line of a non-JSON constructs reply
+_CONSTRUCT_RE = re.compile(r"^\s*[-•*0-9. ]*([A-Za-z][^\n{]{2,}?)\s*$", re.MULTILINE)
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+# Outermost object/array in a reply wrapped in prose
+_JSON_BLOB_RE = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+
+
+def _strip_markdown_fence(text: str) -> str:
+    """Remove a leading ```/```json and trailing ``` fence from an LLM reply."""
+    return _FENCE_RE.sub("", text.strip())
+
+
+def _robust_json_parse(text: str) -> Any:
+    """Parse JSON from an LLM reply.
+    
+    Strips markdown code fences, then tries the strict (fast) parser. If
+    that fails, the outermost ``{...}``/``[...]`` is cut out of any
+    surrounding prose and parsed strictly, then (when json5 is installed)
+    leniently so trailing commas, single quotes and comments still parse.
+    
+    Raises:
+        json.JSONDecodeError: if the reply can't be parsed either way
+    """
+    content = _strip_markdown_fence(text)
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError as err:
+        match = _JSON_BLOB_RE.search(content)
+        blob = match.group() if match else content
+        if blob != content:
+            try:
+                return _json_loads(blob)
+            except json.JSONDecodeError:
+                pass
+        if json5 is None:
+            raise err from None
+        try:
+            return json5.loads(blob)
+        except ValueError:
+            raise err from None
+
+
+def _merge_literature(primary: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Append ``extra``'s papers not already in ``primary`` (by DOI, URL or title)."""
+    def keys(paper: Dict[str, Any]) -> List[str]:
+        found = ["title:" + " ".join(paper.get("title", "").lower().split())]
+        for field in ("doi", "url"):
+            if paper.get(field):
+                found.append(f"{field}:" + paper[field].lower())
+        return found
+    
+    papers = list(primary.get("papers", []))
+    seen = {key for paper in papers for key in keys(paper)}
+    for paper in extra.get("papers", []):
+        paper_keys = keys(paper)
+        if not any(key in seen for key in paper_keys):
+            papers.append(paper)
+        seen.update(paper_keys)
+    return {"papers": papers, "citations": papers}
+
+
+@dataclass
+class _CachedReply:
+    """Stand-in for an LLM response served from the cache."""
+    content: str
+
+
 class LiteratureExplorer:
     """Explores literature landscape from research questions."""
     
-    def __init__(self, llm_manager: LLMManager):
+    def __init__(
+        self,
+        llm_manager: LLMManager,
+        use_cache: bool = True,
+        structured_provider: Optional[str] = None,
+        use_batched: bool = True,
+        prefetch_search: bool = False
+    ):
         """Initialize the Literature Explorer.
         
         Args:
             llm_manager: LLM manager for text generation
+            use_cache: Reuse LLM replies for identical prompts across runs
+                (always off under OFFLINE_MODE)
+            structured_provider: Provider supporting ``response_format``
+                json_schema (e.g. "openai"). When set, the constructs,
+                relationships and analysis calls go to it with strict
+                schemas; otherwise the default provider is asked for JSON
+                in prose.
+            use_batched: Ask for constructs and their relationships in one
+                call instead of two, falling back to separate calls if the
+                combined reply can't be used
+            prefetch_search: Also search on the raw question text while the
+                constructs are extracted, adding its papers to the results
         """
         self.llm = llm_manager
+        self.structured_provider = structured_provider
+        self.use_batched = use_batched
+        self.prefetch_search = prefetch_search
+        # Like ingest_rq, offline/test runs never touch the shared cache
+        if use_cache and ResponseCache is not None and not _offline_mode():
+            self._cache = ResponseCache()
+        else:
+            self._cache = None
+        # Parsed relationships keyed by the (order-insensitive) construct set
+        self._relationship_cache: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
         logger.info("LiteratureExplorer initialized with Google Scholar search")
     
+    async def _cached_chat(
+        self,
+        messages: List[Message],
+        temperature: float,
+        response_format: Optional[Dict[str, Any]] = None
+    ):
+        """``llm.chat`` memoized on the messages and temperature.
+        
+        Prompts here are deterministic functions of their inputs, so reruns
+        on the same research question are served from the disk cache.
+        ``response_format`` is only sent when a structured provider is set.
+        """
+        kwargs: Dict[str, Any] = {"temperature": temperature}
+        model = f"literature_explorer@{temperature}"
+        if response_format is not None and self.structured_provider:
+            kwargs["provider"] = self.structured_provider
+            kwargs["response_format"] = response_format
+            model += f"/{self.structured_provider}:{response_format['json_schema']['name']}"
+        
+        if self._cache is None:
+            return await self.llm.chat(messages=messages, **kwargs)
+        
+        prompt = "\0".join(f"{m.role}:{m.content}" for m in messages)
+        key = cache_key(model, prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _CachedReply(cached)
+        
+        response = await self.llm.chat(messages=messages, **kwargs)
+        if response.content:
+            self._cache.set(key, response.content)
+        return response
+    
     async def explore(self, research_question: ResearchQuestion) -> LiteratureLandscape:
         """Execute the complete literature exploration workflow.
         
@@ -59,34 +432,94 @@ class LiteratureExplorer:
         Returns:
             LiteratureLandscape with knowledge graph and gaps
         """
-        logger.info(f"Starting literature exploration for: {research_question.raw_text}")
+        landscape = None
+        async for event, payload in self.explore_stream(research_question):
+            if event == "landscape":
+                landscape = payload
+        return landscape
+    
+    async def explore_stream(
+        self, research_question: ResearchQuestion
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Run the exploration workflow, yielding each section as it is ready.
+        
+        Yields ``(event, payload)`` pairs: ``constructs``, one ``concept`` per
+        graph node, one ``relationship`` per edge, ``papers``, ``frameworks``,
+        ``measures``, ``paradigms``, ``gaps``, ``summary_delta`` text chunks as
+        the summary is generated, the complete ``summary``, and finally
+        ``landscape`` with the assembled LiteratureLandscape.
         
-        # Step 1: Extract and parse constructs
-        constructs = await self._extract_constructs(research_question)
-        research_question.parsed_constructs = constructs
+        Args:
+            research_question: The research question to explore
+        """
+        logger.info(f"Starting literature exploration for: {research_question.raw_text}")
         
-        # Step 2: Build knowledge graph
-        knowledge_graph = await self._build_knowledge_graph(constructs)
+        # Optionally search on the raw question while the constructs are
+        # being extracted; its papers are appended to the construct search
+        prefetch = None
+        if self.prefetch_search:
+            prefetch = asyncio.create_task(
+                self._search_literature([research_question.raw_text], limit=10)
+            )
         
-        # Step 3: Search and structure literature
-        literature_data = await self._search_literature(constructs)
+        # The prefetch must not outlive this generator, whether a later stage
+        # fails or the consumer stops iterating before it is awaited.
+        try:
+            # Step 1: Extract and parse constructs
+            constructs = await self._extract_constructs(research_question)
+            research_question.parsed_constructs = constructs
+            yield "constructs", constructs
+            
+            # Steps 2-3: Build knowledge graph, search and structure literature.
+            # Both depend only on the constructs, so they are reused across
+            # questions that share them.
+            knowledge_graph, literature_data = await self._construct_stage(constructs)
+            if prefetch is not None:
+                literature_data = _merge_literature(literature_data, await prefetch)
+        finally:
+            if prefetch is not None and not prefetch.done():
+                prefetch.cancel()
         
-        # Step 4: Identify frameworks and measures
-        frameworks = await self._identify_frameworks(literature_data)
-        measures = await self._identify_measures(literature_data, constructs)
-        paradigms = await self._identify_paradigms(literature_data)
+        for concept in knowledge_graph.nodes.values():
+            yield "concept", concept
+        for edge in knowledge_graph.edges:
+            yield "relationship", edge
+        yield "papers", literature_data.get("citations", [])
+        papers_text = self._pack_papers(literature_data.get("papers", []))
         
-        # Step 5: Identify gaps
-        gaps = await self._identify_gaps(research_question, literature_data, knowledge_graph)
+        # Steps 4-5: Identify frameworks, measures, paradigms and gaps in one
+        # fused LLM call. If its reply can't be used, fall back to the
+        # individual calls; they only depend on the literature, constructs
+        # and graph, so they run concurrently.
+        analysis = await self._analyze_literature(
+            research_question, literature_data, constructs, papers_text
+        )
+        if analysis is None:
+            analysis = await asyncio.gather(
+                self._identify_frameworks(papers_text),
+                self._identify_measures(literature_data, constructs),
+                self._identify_paradigms(papers_text),
+                self._identify_gaps(research_question, literature_data, knowledge_graph)
+            )
+        frameworks, measures, paradigms, gaps = analysis
+        yield "frameworks", frameworks
+        yield "measures", measures
+        yield "paradigms", paradigms
+        yield "gaps", gaps
         
-        # Step 6: Generate summary
-        summary = await self._generate_summary(
+        # Step 6: Generate summary, streamed as it is written
+        chunks = []
+        async for chunk in self._stream_summary(
             research_question,
             knowledge_graph,
             frameworks,
             measures,
             gaps
-        )
+        ):
+            chunks.append(chunk)
+            yield "summary_delta", chunk
+        summary = "".join(chunks)
+        yield "summary", summary
         
         # Create landscape object
         landscape = LiteratureLandscape(
@@ -101,7 +534,47 @@ class LiteratureExplorer:
         )
         
         logger.info("Literature exploration completed")
-        return landscape
+        yield "landscape", landscape
+    
+    async def _construct_stage(
+        self, constructs: List[str]
+    ) -> Tuple[KnowledgeGraph, Dict[str, Any]]:
+        """Knowledge graph and literature search for a construct set.
+        
+        Results are kept in the disk cache keyed by the sorted, casefolded
+        constructs. Searches that found no papers are not cached so a
+        transient retrieval failure isn't remembered.
+        
+        Args:
+            constructs: Constructs extracted from the research question
+            
+        Returns:
+            (knowledge_graph, literature_data)
+        """
+        key = None
+        if self._cache is not None and constructs:
+            key = cache_key(
+                "literature_explorer/constructs",
+                "\0".join(self._construct_set_key(constructs)),
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.debug("Reusing knowledge graph and papers for cached constructs")
+                return (
+                    KnowledgeGraph.model_validate(cached["knowledge_graph"]),
+                    cached["literature"],
+                )
+        
+        knowledge_graph, literature_data = await asyncio.gather(
+            self._build_knowledge_graph(constructs),
+            self._search_literature(constructs)
+        )
+        if key is not None and literature_data.get("papers"):
+            self._cache.set(key, {
+                "knowledge_graph": knowledge_graph.model_dump(mode="json"),
+                "literature": literature_data,
+            })
+        return knowledge_graph, literature_data
     
     async def _extract_constructs(self, research_question: ResearchQuestion) -> List[str]:
         """Extract key constructs from research question.
@@ -112,37 +585,78 @@ class LiteratureExplorer:
         Returns:
             List of identified constructs
         """
-        prompt = f"""Analyze this research question and extract the key theoretical constructs, variables, and concepts.
-
-Research Question: {research_question.raw_text}
-
-Provide a list of 3-7 key constructs that are central to this research question.
-Focus on:
-- Psychological/behavioral constructs (e.g., attachment, emotion regulation)
-- Outcome variables (e.g., well-being, performance)
-- Populations or contexts if specific
-
-Return as a JSON array of strings."""
+        if self.use_batched:
+            constructs = await self._extract_concepts(research_question)
+            if constructs is not None:
+                return constructs
+        
+        prompt = f"Research Question: {research_question.raw_text}"
         
-        response = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.3
+        response = await self._cached_chat(
+            messages=_messages(CONSTRUCTS_SYSTEM_PROMPT, prompt),
+            temperature=0.3,
+            response_format=CONSTRUCTS_FORMAT
         )
         
         # Parse constructs from response
-        import json
         try:
-            constructs = json.loads(response.content)
-            if isinstance(constructs, dict) and "constructs" in constructs:
-                constructs = constructs["constructs"]
-        except json.JSONDecodeError:
+            constructs = _robust_json_parse(response.content)
+            if isinstance(constructs, dict):
+                constructs = constructs.get("constructs", [])
+            if not isinstance(constructs, list):
+                raise TypeError("constructs reply is not a list")
+            constructs = [c for c in constructs if isinstance(c, str)]
+        except (json.JSONDecodeError, TypeError):
             # Fallback: extract from text
-            constructs = [c.strip() for c in response.content.split("\n") if c.strip() and not c.startswith("{")]
-            constructs = [c.lstrip("-•*123456789. ") for c in constructs if len(c) > 2]
+            constructs = _CONSTRUCT_RE.findall(response.content)
         
         logger.debug(f"Extracted constructs: {constructs}")
         return constructs[:7]  # Limit to 7
     
+    async def _extract_concepts(self, research_question: ResearchQuestion) -> Optional[List[str]]:
+        """Extract constructs and their relationships with one LLM call.
+        
+        The relationships are stored in the relationship memo, so building
+        the knowledge graph for these constructs needs no further call.
+        
+        Args:
+            research_question: Research question to analyze
+            
+        Returns:
+            Up to 7 constructs, or None if the reply could not be used
+        """
+        prompt = f"Research Question: {research_question.raw_text}"
+        
+        response = await self._cached_chat(
+            messages=_messages(CONCEPTS_SYSTEM_PROMPT, prompt),
+            temperature=0.3,
+            response_format=CONCEPTS_FORMAT
+        )
+        
+        try:
+            data = _robust_json_parse(response.content)
+            constructs = data["constructs"]
+            relationships = data.get("relationships", [])
+            if not (isinstance(constructs, list) and isinstance(relationships, list)):
+                raise TypeError("unexpected section types")
+            constructs = [c for c in constructs if isinstance(c, str) and c.strip()][:7]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Combined concept extraction unusable ({e}), falling back to separate calls")
+            return None
+        if not constructs:
+            return None
+        
+        self._relationship_cache[self._construct_set_key(constructs)] = [
+            rel for rel in relationships if isinstance(rel, dict)
+        ]
+        logger.debug(f"Extracted constructs: {constructs}")
+        return constructs
+    
+    @staticmethod
+    def _construct_set_key(constructs: List[str]) -> Tuple[str, ...]:
+        """Order- and case-insensitive key for a construct set."""
+        return tuple(sorted(c.casefold() for c in constructs))
+    
     async def _build_knowledge_graph(self, constructs: List[str]) -> KnowledgeGraph:
         """Build a knowledge graph from constructs.
         
@@ -153,10 +667,14 @@ Return as a JSON array of strings."""
             KnowledgeGraph with nodes and edges
         """
         graph = KnowledgeGraph()
+        if not constructs:
+            return graph
         
-        # Create nodes for each construct
+        # Create nodes for each construct; IDs derive from the label so the
+        # same construct list always yields the same graph
         for construct in constructs:
-            concept_id = f"concept_{uuid.uuid4().hex[:8]}"
+            digest = hashlib.blake2b(construct.lower().encode("utf-8"), digest_size=4)
+            concept_id = f"concept_{digest.hexdigest()}"
             concept = Concept(
                 id=concept_id,
                 label=construct,
@@ -164,74 +682,76 @@ Return as a JSON array of strings."""
             )
             graph.add_node(concept)
         
-        # Identify relationships between constructs
-        if len(constructs) > 1:
-            prompt = f"""Given these psychological/research constructs, identify the key theoretical relationships between them.
-
-Constructs: {', '.join(constructs)}
-
-For each relationship, specify:
-- source construct
-- target construct  
-- relationship type (predicts, associated_with, moderates, mediates)
-
-Return as JSON array of objects with 'source', 'target', 'relation_type' fields.
-Only include well-established theoretical relationships."""
-            
-            response = await self.llm.chat(
-                messages=[Message(role="user", content=prompt)],
-                temperature=0.3
-            )
-            
-            # Parse relationships
-            import json
-            try:
-                # Clean response content - sometimes LLM wraps JSON in markdown
-                content = response.content.strip()
-                if content.startswith("```"):
-                    # Remove markdown code blocks
-                    lines = content.split("\n")
-                    content = "\n".join(lines[1:-1]) if len(lines) > 2 else content
-                    content = content.replace("```json", "").replace("```", "").strip()
-                
-                relationships = json.loads(content)
-                if isinstance(relationships, dict) and "relationships" in relationships:
-                    relationships = relationships["relationships"]
-                
-                # Add edges to graph
-                concept_map = {c.label.lower(): c.id for c in graph.nodes.values()}
-                for rel in relationships:
-                    source_label = rel.get("source", "").lower()
-                    target_label = rel.get("target", "").lower()
-                    if source_label in concept_map and target_label in concept_map:
-                        edge = ConceptEdge(
-                            source=concept_map[source_label],
-                            target=concept_map[target_label],
-                            relation_type=rel.get("relation_type", "associated_with")
-                        )
-                        graph.add_edge(edge)
-                logger.debug(f"Added {len(graph.edges)} relationships to knowledge graph")
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                logger.debug(f"Could not parse relationships from LLM response, continuing without them. Response was: {response.content[:200]}")
-                # Continue without relationships - knowledge graph will have nodes but no edges
+        # Identify relationships between constructs (duplicate constructs
+        # share a node, so this counts distinct ones)
+        if len(graph.nodes) > 1:
+            for rel in await self._identify_relationships(constructs):
+                source_id = graph.find_node_by_label(rel.get("source") or "")
+                target_id = graph.find_node_by_label(rel.get("target") or "")
+                if source_id is not None and target_id is not None:
+                    edge = ConceptEdge(
+                        source=source_id,
+                        target=target_id,
+                        relation_type=rel.get("relation_type", "associated_with")
+                    )
+                    graph.add_edge(edge)
+            logger.debug(f"Added {len(graph.edges)} relationships to knowledge graph")
         
         return graph
-    async def _search_literature(self, constructs: List[str]) -> Dict[str, Any]:
+    
+    async def _identify_relationships(self, constructs: List[str]) -> List[Dict[str, Any]]:
+        """Ask the LLM how the constructs relate, memoized per construct set.
+        
+        Args:
+            constructs: At least two constructs
+            
+        Returns:
+            Relationship dicts with source, target and relation_type; empty
+            if the reply couldn't be parsed
+        """
+        key = self._construct_set_key(constructs)
+        cached = self._relationship_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = f"Constructs: {', '.join(constructs)}"
+        response = await self._cached_chat(
+            messages=_messages(RELATIONSHIPS_SYSTEM_PROMPT, prompt),
+            temperature=0.3,
+            response_format=RELATIONSHIPS_FORMAT
+        )
+        
+        try:
+            relationships = _robust_json_parse(response.content)
+            if isinstance(relationships, dict) and "relationships" in relationships:
+                relationships = relationships["relationships"]
+            relationships = [rel for rel in relationships if isinstance(rel, dict)]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.debug(f"Could not parse relationships from LLM response, continuing without them. Response was: {response.content[:200]}")
+            # Continue without relationships - knowledge graph will have nodes but no edges
+            return []
+        
+        self._relationship_cache[key] = relationships
+        return relationships
+    
+    async def _search_literature(self, constructs: List[str], limit: int = 20) -> Dict[str, Any]:
         """Search academic literature for constructs using OpenAlex (free API).
         
         Args:
             constructs: List of constructs to search
+            limit: Maximum number of papers
             
         Returns:
             Dictionary with search results and citations
         """
-        if not SEARCH_AVAILABLE:
+        retrieve_papers = _get_retrieve_papers()
+        if retrieve_papers is None:
             logger.debug("OpenAlex paper retrieval not available, using empty data")
             return {"papers": [], "citations": []}
         
         try:
             # Use free OpenAlex API to retrieve papers
-            papers = await retrieve_papers(constructs, limit=20)
+            papers = await retrieve_papers(constructs, limit=limit)
             
             # Convert Paper objects to dict format with proper type conversion
             # LiteratureLandscape expects Dict[str, str], but Paper.to_dict() returns mixed types
@@ -260,49 +780,64 @@ Only include well-established theoretical relationships."""
             logger.error(f"Google Scholar search failed: {e}")
             return {"papers": [], "citations": []}
     
-    async def _identify_frameworks(self, literature_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _pack_papers(
+        papers: List[Dict[str, Any]],
+        token_budget: int = PAPERS_TOKEN_BUDGET,
+        abs_len: int = ABSTRACT_CHARS
+    ) -> str:
+        """Title plus abstract excerpt per paper, one per line, within a budget.
+        
+        Papers are added in retrieval (relevance) order until the next line
+        would exceed ``token_budget``; short abstracts leave room for more
+        papers. Built once per exploration and shared by every prompt that
+        lists papers.
+        """
+        char_budget = token_budget * CHARS_PER_TOKEN
+        lines = []
+        used = 0
+        for p in papers:
+            line = p.get("title", "") + " " + p.get("abstract", "")[:abs_len]
+            used += len(line) + 1
+            if used > char_budget and lines:
+                break
+            lines.append(line)
+        return "\n".join(lines)
+    
+    async def _identify_frameworks(self, papers_text: str) -> List[Dict[str, Any]]:
         """Identify theoretical frameworks from literature.
         
         Args:
-            literature_data: Search results
+            papers_text: Paper snippets from _pack_papers
             
         Returns:
             List of framework descriptions
         """
-        papers_text = "\n".join([p.get("title", "") + " " + p.get("abstract", "")[:200] 
-                                  for p in literature_data.get("papers", [])[:10]])
-        
-        if not papers_text.strip():
+        if len(papers_text.strip()) < MIN_PAPERS_CHARS:
             return [{"name": "General theoretical framework", "description": "Standard research approach in this domain"}]
         
-        prompt = f"""Based on these research papers, identify 2-4 major theoretical frameworks that are commonly used.
-
-Papers:
-{papers_text}
-
-For each framework, provide:
-- name
-- brief description (1-2 sentences)
-
-Return as JSON array of objects with 'name' and 'description' fields."""
+        prompt = f"Papers:\n{papers_text}"
         
-        response = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.4
+        response = await self._cached_chat(
+            messages=_messages(FRAMEWORKS_SYSTEM_PROMPT, prompt),
+            temperature=0.4,
+            response_format=FRAMEWORKS_FORMAT
         )
         
-        import json
         try:
-            frameworks = json.loads(response.content)
+            frameworks = _robust_json_parse(response.content)
             if isinstance(frameworks, dict) and "frameworks" in frameworks:
                 frameworks = frameworks["frameworks"]
             return frameworks[:4]
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError):
             return [{"name": "General theoretical framework", "description": "Standard research approach"}]
     
     async def _identify_measures(self, literature_data: Dict[str, Any], constructs: List[str]) -> Dict[str, List[str]]:
         """Identify common measurement instruments.
         
+        One short request per construct, run concurrently; each is cached on
+        its own, so constructs shared between projects are answered locally.
+        
         Args:
             literature_data: Search results
             constructs: List of constructs
@@ -310,68 +845,68 @@ Return as JSON array of objects with 'name' and 'description' fields."""
         Returns:
             Dictionary mapping constructs to measurement scales
         """
-        measures_map = {}
-        
-        prompt = f"""For each of these psychological constructs, list 2-4 commonly used measurement scales or instruments.
-
-Constructs: {', '.join(constructs)}
-
-Return as JSON object where keys are constructs and values are arrays of scale names.
-Example: {{"anxiety": ["STAI", "GAD-7"], "attachment": ["ECR-R", "AAI"]}}"""
+        semaphore = asyncio.Semaphore(MEASURES_CONCURRENCY)
+        scales = await asyncio.gather(*(
+            self._measures_for(construct, semaphore) for construct in constructs
+        ))
+        return dict(zip(constructs, scales))
+    
+    async def _measures_for(self, construct: str, semaphore: asyncio.Semaphore) -> List[str]:
+        """Measurement scales for a single construct.
         
-        response = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.3
-        )
+        Args:
+            construct: Construct to look up
+            semaphore: Limits concurrent requests
+            
+        Returns:
+            Scale names, or generic placeholders if the reply can't be parsed
+        """
+        async with semaphore:
+            response = await self._cached_chat(
+                messages=_messages(MEASURES_SYSTEM_PROMPT, f"Construct: {construct}"),
+                temperature=0.3,
+                response_format=MEASURES_FORMAT
+            )
         
-        import json
         try:
-            measures_map = json.loads(response.content)
+            scales = _robust_json_parse(response.content)
+            if isinstance(scales, dict):
+                # {"<construct>": [...]} or {"scales": [...]}
+                scales = next(iter(scales.values()), [])
+            if isinstance(scales, list):
+                scales = [s for s in scales if isinstance(s, str)]
+                if scales:
+                    return scales
         except json.JSONDecodeError:
-            # Fallback
-            for construct in constructs:
-                measures_map[construct] = [f"{construct.title()} Scale", f"{construct.title()} Questionnaire"]
-        
-        return measures_map
+            pass
+        return [f"{construct.title()} Scale", f"{construct.title()} Questionnaire"]
     
-    async def _identify_paradigms(self, literature_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_paradigms(self, papers_text: str) -> List[Dict[str, Any]]:
         """Identify experimental paradigms and tasks.
         
         Args:
-            literature_data: Search results
+            papers_text: Paper snippets from _pack_papers
             
         Returns:
             List of paradigm descriptions
         """
-        papers_text = "\n".join([p.get("title", "") + " " + p.get("abstract", "")[:200] 
-                                  for p in literature_data.get("papers", [])[:10]])
-        
-        if not papers_text.strip():
+        if len(papers_text.strip()) < MIN_PAPERS_CHARS:
             return [{"name": "Standard experimental design", "description": "Typical methodology in this area"}]
         
-        prompt = f"""Based on these papers, identify 2-3 common experimental paradigms or tasks used in this research area.
-
-Papers:
-{papers_text}
-
-For each paradigm, provide:
-- name
-- description (what participants do)
-
-Return as JSON array of objects with 'name' and 'description' fields."""
+        prompt = f"Papers:\n{papers_text}"
         
-        response = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.4
+        response = await self._cached_chat(
+            messages=_messages(PARADIGMS_SYSTEM_PROMPT, prompt),
+            temperature=0.4,
+            response_format=PARADIGMS_FORMAT
         )
         
-        import json
         try:
-            paradigms = json.loads(response.content)
+            paradigms = _robust_json_parse(response.content)
             if isinstance(paradigms, dict) and "paradigms" in paradigms:
                 paradigms = paradigms["paradigms"]
             return paradigms[:3]
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError):
             return [{"name": "Standard experimental design", "description": "Typical methodology"}]
     
     async def _identify_gaps(self, research_question: ResearchQuestion, 
@@ -390,29 +925,18 @@ Return as JSON array of objects with 'name' and 'description' fields."""
         constructs = research_question.parsed_constructs
         papers_summary = f"{len(literature_data.get('papers', []))} papers found"
         
-        prompt = f"""Analyze the research landscape and identify key gaps.
-
-Research Question: {research_question.raw_text}
+        prompt = f"""Research Question: {research_question.raw_text}
 Constructs: {', '.join(constructs)}
-Literature: {papers_summary}
-
-Identify gaps in:
-1. Missing variable combinations (which constructs haven't been studied together?)
-2. Unexplored populations (age groups, cultures, contexts not well studied)
-3. Methodological gaps (needed approaches, designs, measures)
-4. Theoretical gaps (unanswered questions, mechanisms)
-
-Return as JSON with fields: 'description', 'missing_combinations', 'unexplored_populations', 'methodological_gaps', 'theoretical_gaps'.
-Each field except 'description' should be an array of strings."""
+Literature: {papers_summary}"""
         
-        response = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.5
+        response = await self._cached_chat(
+            messages=_messages(GAPS_SYSTEM_PROMPT, prompt),
+            temperature=0.5,
+            response_format=GAPS_FORMAT
         )
         
-        import json
         try:
-            gaps_data = json.loads(response.content)
+            gaps_data = _robust_json_parse(response.content)
             return LiteratureGap(
                 description=gaps_data.get("description", "Several research gaps identified"),
                 missing_combinations=gaps_data.get("missing_combinations", []),
@@ -420,7 +944,7 @@ Each field except 'description' should be an array of strings."""
                 methodological_gaps=gaps_data.get("methodological_gaps", []),
                 theoretical_gaps=gaps_data.get("theoretical_gaps", [])
             )
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, AttributeError, ValueError):
             return LiteratureGap(
                 description="Research gaps exist in construct combinations and populations",
                 missing_combinations=[f"{constructs[0]} + {constructs[1]}"] if len(constructs) >= 2 else [],
@@ -429,6 +953,70 @@ Each field except 'description' should be an array of strings."""
                 theoretical_gaps=["Underlying mechanisms"]
             )
     
+    async def _analyze_literature(
+        self,
+        research_question: ResearchQuestion,
+        literature_data: Dict[str, Any],
+        constructs: List[str],
+        papers_text: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, List[str]], List[Dict[str, Any]], LiteratureGap]]:
+        """Identify frameworks, measures, paradigms and gaps with one LLM call.
+        
+        Args:
+            research_question: Original research question
+            literature_data: Search results
+            constructs: List of constructs
+            papers_text: Paper snippets from _pack_papers
+            
+        Returns:
+            (frameworks, measures, paradigms, gaps), or None if the reply
+            could not be parsed
+        """
+        papers = literature_data.get("papers", [])
+        
+        prompt = f"""Research Question: {research_question.raw_text}
+Constructs: {', '.join(constructs)}
+Literature: {len(papers)} papers found
+
+Papers:
+{papers_text or "(none)"}"""
+        
+        response = await self._cached_chat(
+            messages=_messages(ANALYSIS_SYSTEM_PROMPT, prompt),
+            temperature=0.4,
+            response_format=ANALYSIS_FORMAT
+        )
+        
+        try:
+            data = _robust_json_parse(response.content)
+            frameworks = data["frameworks"]
+            measures = data["measures"]
+            paradigms = data["paradigms"]
+            gaps_data = data["gaps"]
+            if isinstance(measures, list):
+                # ANALYSIS_FORMAT shape
+                measures = {m["construct"]: m["scales"] for m in measures}
+            if not (isinstance(frameworks, list) and isinstance(measures, dict)
+                    and isinstance(paradigms, list) and isinstance(gaps_data, dict)):
+                raise TypeError("unexpected section types")
+            gaps = LiteratureGap(
+                description=gaps_data.get("description", "Several research gaps identified"),
+                missing_combinations=gaps_data.get("missing_combinations", []),
+                unexplored_populations=gaps_data.get("unexplored_populations", []),
+                methodological_gaps=gaps_data.get("methodological_gaps", []),
+                theoretical_gaps=gaps_data.get("theoretical_gaps", [])
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Fused literature analysis unusable ({e}), falling back to separate calls")
+            return None
+        
+        if len(papers_text.strip()) < MIN_PAPERS_CHARS:
+            # Same defaults the separate helpers use for too little paper text
+            frameworks = [{"name": "General theoretical framework", "description": "Standard research approach in this domain"}]
+            paradigms = [{"name": "Standard experimental design", "description": "Typical methodology in this area"}]
+        
+        return frameworks[:4], measures, paradigms[:3], gaps
+    
     async def _generate_summary(self, research_question: ResearchQuestion,
                                knowledge_graph: KnowledgeGraph,
                                frameworks: List[Dict[str, Any]],
@@ -446,28 +1034,54 @@ Each field except 'description' should be an array of strings."""
         Returns:
             Formatted summary text
         """
-        prompt = f"""Create a concise summary (3-4 paragraphs) of the literature landscape for this research question.
-
-Research Question: {research_question.raw_text}
+        chunks = [chunk async for chunk in self._stream_summary(
+            research_question, knowledge_graph, frameworks, measures, gaps
+        )]
+        return "".join(chunks)
+    
+    async def _stream_summary(self, research_question: ResearchQuestion,
+                              knowledge_graph: KnowledgeGraph,
+                              frameworks: List[Dict[str, Any]],
+                              measures: Dict[str, List[str]],
+                              gaps: LiteratureGap) -> AsyncIterator[str]:
+        """Stream the landscape summary as text chunks while it is generated.
+        
+        A cached summary is yielded as a single chunk; a fresh one is streamed
+        from the LLM and cached once complete.
+        
+        Args:
+            research_question: Original question
+            knowledge_graph: Knowledge graph
+            frameworks: Identified frameworks
+            measures: Common measures
+            gaps: Research gaps
+        """
+        prompt = f"""Research Question: {research_question.raw_text}
 
 Key Constructs: {', '.join(research_question.parsed_constructs)}
 Theoretical Frameworks: {', '.join([f['name'] for f in frameworks])}
 Key Measures: {', '.join([f"{k}: {', '.join(v[:2])}" for k, v in list(measures.items())[:3]])}
 
 Research Gaps:
-{gaps.description}
-
-Write a clear, informative summary that:
-1. Describes the current state of research
-2. Highlights key theoretical perspectives
-3. Notes common methodological approaches
-4. Emphasizes the identified gaps
-
-Use professional academic tone."""
+{gaps.description}"""
+        messages = _messages(SUMMARY_SYSTEM_PROMPT, prompt)
+        temperature = 0.6
         
-        summary = await self.llm.chat(
-            messages=[Message(role="user", content=prompt)],
-            temperature=0.6
-        )
+        key = None
+        if self._cache is not None:
+            key = cache_key(
+                f"literature_explorer@{temperature}",
+                "\0".join(f"{m.role}:{m.content}" for m in messages),
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                yield cached
+                return
         
-        return summary.content
+        chunks = []
+        async for chunk in self.llm.chat_stream(messages=messages, temperature=temperature):
+            if chunk:
+                chunks.append(chunk)
+                yield chunk
+        if key is not None and chunks:
+            self._cache.set(key, "".join(chunks))
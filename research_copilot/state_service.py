@@ -4,13 +4,25 @@ Provides persistence and management for research project state,
 enabling versioning, checkpointing, and state transitions.
 """
 
+import asyncio
+import gzip
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Set, Tuple
 import uuid
 
+from pydantic_core import to_json
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
 from models import (
     ProjectState,
     ProjectStatus,
@@ -19,11 +31,16 @@ from models import (
     HypothesisSet,
     ExperimentDesign,
     StimulusBank,
-    SimulationResults
+    SimulationResults,
+    utcnow
 )
 
 logger = logging.getLogger(__name__)
 
+# Checkpoints are write-once snapshots; a low gzip level keeps saves fast
+# while still shrinking citation-heavy states several times over.
+CHECKPOINT_COMPRESSLEVEL = 3
+
 
 class ProjectStateService:
     """Manages research project state with versioning and persistence."""
@@ -36,6 +53,30 @@ class ProjectStateService:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write-behind buffers: latest unsaved state per project, and the
+        # batch currently being written by the flush task.
+        self._pending: Dict[str, ProjectState] = {}
+        self._inflight: Dict[str, ProjectState] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Projects deleted while a flush may still hold them; the flusher
+        # checks this under _write_lock so it never recreates their files.
+        # Only needed while flushes are running, so it is cleared once the
+        # last of them finishes.
+        self._deleted: Set[str] = set()
+        self._write_lock = threading.Lock()
+        self._flushing = 0
+        
+        # Serialized projects keyed by id, tagged with the (mtime_ns, size) of
+        # the state file they came from so external edits invalidate the entry.
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Listing metadata for every project, mirrored to manifest.json so
+        # list_projects doesn't have to open each state file.
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._manifest_lock = threading.Lock()
+        
         logger.info(f"ProjectStateService initialized with storage at {self.storage_dir}")
     
     def _get_project_dir(self, project_id: str) -> Path:
@@ -46,11 +87,19 @@ class ProjectStateService:
         """Get the main state file for a project."""
         return self._get_project_dir(project_id) / "state.json"
     
+    def _get_manifest_file(self) -> Path:
+        """Get the project listing manifest path."""
+        return self.storage_dir / "manifest.json"
+    
     def _get_checkpoint_file(self, project_id: str, checkpoint_name: str) -> Path:
-        """Get a checkpoint file path."""
+        """Get a checkpoint file path (gzip-compressed JSON).
+        
+        Checkpoints written before compression was introduced are plain
+        ``.json`` next to it: ``path.with_suffix("")``.
+        """
         checkpoints_dir = self._get_project_dir(project_id) / "checkpoints"
         checkpoints_dir.mkdir(exist_ok=True)
-        return checkpoints_dir / f"{checkpoint_name}.json"
+        return checkpoints_dir / f"{checkpoint_name}.json.gz"
     
     def create_project(self, name: str, research_question_text: str) -> ProjectState:
         """Create a new research project.
@@ -81,6 +130,93 @@ class ProjectStateService:
         logger.info(f"Created project {project_id}: {name}")
         return project
     
+    _CACHE_SIZE = 128
+    
+    @staticmethod
+    def _file_version(state_file: Path) -> Tuple[int, int]:
+        """Cheap change marker for a state file."""
+        stat = state_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _cache_put(self, project_id: str, version: Tuple[int, int], raw: bytes) -> None:
+        with self._cache_lock:
+            self._cache[project_id] = (version, raw)
+            self._cache.move_to_end(project_id)
+            while len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _cache_get(self, project_id: str, version: Tuple[int, int]) -> Optional[bytes]:
+        with self._cache_lock:
+            entry = self._cache.get(project_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._cache.move_to_end(project_id)
+            return entry[1]
+    
+    @staticmethod
+    def _serialize(project: ProjectState) -> bytes:
+        """Compact UTF-8 JSON straight from pydantic-core (no intermediate dict or str)."""
+        return to_json(project)
+    
+    @staticmethod
+    def _write_atomic(path: Path, raw: bytes) -> None:
+        """Write via a temp file and rename, so readers never see a partial file."""
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(raw)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    
+    _MANIFEST_FIELDS = ("id", "name", "status", "created_at", "updated_at")
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Return the in-memory manifest, reading or rebuilding it on first use.
+        
+        Caller must hold ``_manifest_lock``. A manifest whose project ids
+        don't match the project directories (written by an older version,
+        or projects added/removed behind our back) is rebuilt by scanning.
+        """
+        if self._manifest is not None:
+            return self._manifest
+        
+        project_ids = {
+            d.name for d in self.storage_dir.iterdir()
+            if d.is_dir() and (d / "state.json").exists()
+        }
+        manifest = None
+        try:
+            manifest = _json_loads(self._get_manifest_file().read_bytes())
+        except (OSError, ValueError):
+            pass
+        if not isinstance(manifest, dict) or set(manifest) != project_ids:
+            manifest = {}
+            for project_id in project_ids:
+                try:
+                    data = _json_loads(self._get_state_file(project_id).read_bytes())
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Skipping unreadable project {project_id} in manifest: {e}")
+                    continue
+                manifest[project_id] = {k: data.get(k) for k in self._MANIFEST_FIELDS}
+            self._write_atomic(self._get_manifest_file(), to_json(manifest))
+            logger.debug(f"Rebuilt project manifest ({len(manifest)} projects)")
+        self._manifest = manifest
+        return manifest
+    
+    def _update_manifest(self, project_id: str, row: Optional[Dict[str, Any]]) -> None:
+        """Upsert (or with ``row=None`` remove) a project's listing row."""
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            if row is None:
+                if manifest.pop(project_id, None) is None:
+                    return
+            elif manifest.get(project_id) == row:
+                return
+            else:
+                manifest[project_id] = row
+            self._write_atomic(self._get_manifest_file(), to_json(manifest))
+    
     def save_project(self, project: ProjectState) -> None:
         """Save project state to disk.
         
@@ -91,53 +227,163 @@ class ProjectStateService:
         project_dir.mkdir(parents=True, exist_ok=True)
         
         state_file = self._get_state_file(project.id)
-        with open(state_file, 'w') as f:
-            json.dump(project.model_dump(mode='json'), f, indent=2, default=str)
+        raw = self._serialize(project)
+        self._write_atomic(state_file, raw)
+        self._cache_put(project.id, self._file_version(state_file), raw)
+        self._update_manifest(
+            project.id, project.model_dump(mode="json", include=set(self._MANIFEST_FIELDS))
+        )
         
         logger.debug(f"Saved project {project.id}")
     
+    def enqueue_save(self, project: ProjectState) -> None:
+        """Persist a project, deferring the disk write when write-behind is on.
+        
+        Repeated updates to the same project between flushes coalesce into
+        a single write. Without a running flush task this saves immediately.
+        
+        Args:
+            project: Project state to save
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self.save_project(project)
+            return
+        self._deleted.discard(project.id)
+        self._pending[project.id] = project
+    
+    def _write_batch(self, batch: Dict[str, ProjectState]) -> None:
+        """Write a batch of pending projects to disk."""
+        for project in batch.values():
+            try:
+                with self._write_lock:
+                    if project.id in self._deleted:
+                        continue
+                    self.save_project(project)
+            except Exception as e:
+                logger.error(f"Write-behind save failed for project {project.id}: {e}")
+    
+    async def flush(self, project_id: Optional[str] = None) -> None:
+        """Write pending updates to disk now.
+        
+        Args:
+            project_id: Flush only this project (default: all pending)
+        """
+        # Counted before taking the batch, so a concurrent delete_project
+        # knows to leave a tombstone for anything this flush picks up
+        self._flushing += 1
+        try:
+            if project_id is None:
+                batch, self._pending = self._pending, {}
+            elif project_id in self._pending:
+                batch = {project_id: self._pending.pop(project_id)}
+            else:
+                return
+            if not batch:
+                return
+            self._inflight.update(batch)
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            finally:
+                for pid, project in batch.items():
+                    if self._inflight.get(pid) is project:
+                        del self._inflight[pid]
+        finally:
+            self._flushing -= 1
+            if not self._flushing:
+                self._deleted.clear()
+    
+    async def _flush_loop(self, interval: float) -> None:
+        """Background task: flush coalesced updates every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+    
+    def start_write_behind(self, interval: float = 0.1) -> None:
+        """Start batching project saves on a background flush task.
+        
+        Must be called from a running event loop (e.g. an app lifespan).
+        
+        Args:
+            interval: Seconds between flushes
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop(interval))
+            logger.info(f"Write-behind persistence enabled (flush every {interval}s)")
+    
+    async def stop_write_behind(self) -> None:
+        """Stop the flush task and write everything still pending."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+    
+    # Async variants for callers on the event loop: the blocking disk work
+    # runs in a worker thread so other requests and streams keep running.
+    
+    async def asave_project(self, project: ProjectState) -> None:
+        """``save_project`` off the event loop."""
+        await asyncio.to_thread(self.save_project, project)
+    
+    async def acreate_project(self, name: str, research_question_text: str) -> ProjectState:
+        """``create_project`` off the event loop."""
+        return await asyncio.to_thread(self.create_project, name, research_question_text)
+    
+    async def alist_projects(self) -> List[Dict[str, Any]]:
+        """``list_projects`` off the event loop (the first call may rebuild the manifest)."""
+        return await asyncio.to_thread(self.list_projects)
+    
+    async def acreate_checkpoint(self, project_id: str, checkpoint_name: str) -> None:
+        """``create_checkpoint`` off the event loop."""
+        await asyncio.to_thread(self.create_checkpoint, project_id, checkpoint_name)
+    
     def load_project(self, project_id: str) -> Optional[ProjectState]:
         """Load project state from disk.
         
+        Updates still waiting for a write-behind flush are returned in
+        preference to the on-disk copy.
+        
         Args:
             project_id: Project identifier
             
         Returns:
             ProjectState if found, None otherwise
         """
+        buffered = self._pending.get(project_id) or self._inflight.get(project_id)
+        if buffered is not None:
+            return buffered.model_copy(deep=True)
+        
         state_file = self._get_state_file(project_id)
-        if not state_file.exists():
+        try:
+            version = self._file_version(state_file)
+        except FileNotFoundError:
             logger.warning(f"Project {project_id} not found")
             return None
         
-        with open(state_file, 'r') as f:
-            data = json.load(f)
-        
-        project = ProjectState(**data)
-        logger.debug(f"Loaded project {project_id}")
-        return project
+        # Callers mutate what they load, so every load builds a fresh object.
+        # Re-validating trusted cached JSON in pydantic-core is several times
+        # cheaper than deep-copying a parsed model tree.
+        raw = self._cache_get(project_id, version)
+        if raw is None:
+            raw = state_file.read_bytes()
+            self._cache_put(project_id, version, raw)
+            logger.debug(f"Loaded project {project_id}")
+        return ProjectState.model_validate_json(raw)
     
     def list_projects(self) -> List[Dict[str, Any]]:
         """List all projects with basic metadata.
         
+        Served from the manifest, so no state file is opened.
+        
         Returns:
             List of project metadata dictionaries
         """
-        projects = []
-        for project_dir in self.storage_dir.iterdir():
-            if project_dir.is_dir():
-                state_file = project_dir / "state.json"
-                if state_file.exists():
-                    with open(state_file, 'r') as f:
-                        data = json.load(f)
-                        projects.append({
-                            "id": data["id"],
-                            "name": data["name"],
-                            "status": data["status"],
-                            "created_at": data["created_at"],
-                            "updated_at": data["updated_at"]
-                        })
-        return sorted(projects, key=lambda p: p["updated_at"], reverse=True)
+        with self._manifest_lock:
+            projects = [dict(row) for row in self._load_manifest().values()]
+        return sorted(projects, key=lambda p: p["updated_at"] or "", reverse=True)
     
     def update_research_question(self, project_id: str, research_question: ResearchQuestion) -> ProjectState:
         """Update research question for a project.
@@ -154,8 +400,8 @@ class ProjectStateService:
             raise ValueError(f"Project {project_id} not found")
         
         project.research_question = research_question
-        project.updated_at = datetime.utcnow()
-        self.save_project(project)
+        project.updated_at = utcnow()
+        self.enqueue_save(project)
         return project
     
     def update_literature_landscape(self, project_id: str, landscape: LiteratureLandscape) -> ProjectState:
@@ -174,7 +420,7 @@ class ProjectStateService:
         
         project.literature_landscape = landscape
         project.update_status(ProjectStatus.LITERATURE_REVIEW)
-        self.save_project(project)
+        self.enqueue_save(project)
         logger.info(f"Updated literature landscape for project {project_id}")
         return project
     
@@ -194,7 +440,7 @@ class ProjectStateService:
         
         project.hypothesis_set = hypothesis_set
         project.update_status(ProjectStatus.HYPOTHESIS_GENERATION)
-        self.save_project(project)
+        self.enqueue_save(project)
         logger.info(f"Updated hypothesis set for project {project_id}")
         return project
     
@@ -214,7 +460,7 @@ class ProjectStateService:
         
         project.experiment_design = design
         project.update_status(ProjectStatus.DESIGN_BUILDING)
-        self.save_project(project)
+        self.enqueue_save(project)
         logger.info(f"Updated experiment design for project {project_id}")
         return project
     
@@ -234,7 +480,7 @@ class ProjectStateService:
         
         project.stimulus_bank = stimulus_bank
         project.update_status(ProjectStatus.STIMULUS_GENERATION)
-        self.save_project(project)
+        self.enqueue_save(project)
         logger.info(f"Updated stimulus bank for project {project_id}")
         return project
     
@@ -254,7 +500,7 @@ class ProjectStateService:
         
         project.simulation_results = results
         project.update_status(ProjectStatus.SIMULATION)
-        self.save_project(project)
+        self.enqueue_save(project)
         logger.info(f"Updated simulation results for project {project_id}")
         return project
     
@@ -270,8 +516,10 @@ class ProjectStateService:
             raise ValueError(f"Project {project_id} not found")
         
         checkpoint_file = self._get_checkpoint_file(project_id, checkpoint_name)
-        with open(checkpoint_file, 'w') as f:
-            json.dump(project.model_dump(mode='json'), f, indent=2, default=str)
+        self._write_atomic(
+            checkpoint_file,
+            gzip.compress(self._serialize(project), compresslevel=CHECKPOINT_COMPRESSLEVEL)
+        )
         
         logger.info(f"Created checkpoint '{checkpoint_name}' for project {project_id}")
     
@@ -286,15 +534,17 @@ class ProjectStateService:
             Restored ProjectState
         """
         checkpoint_file = self._get_checkpoint_file(project_id, checkpoint_name)
-        if not checkpoint_file.exists():
+        legacy_file = checkpoint_file.with_suffix("")
+        if checkpoint_file.exists():
+            raw = gzip.decompress(checkpoint_file.read_bytes())
+        elif legacy_file.exists():
+            raw = legacy_file.read_bytes()
+        else:
             raise ValueError(f"Checkpoint '{checkpoint_name}' not found for project {project_id}")
         
-        with open(checkpoint_file, 'r') as f:
-            data = json.load(f)
-        
-        project = ProjectState(**data)
-        project.updated_at = datetime.utcnow()
-        self.save_project(project)
+        project = ProjectState.model_validate_json(raw)
+        project.updated_at = utcnow()
+        self.enqueue_save(project)
         logger.info(f"Restored checkpoint '{checkpoint_name}' for project {project_id}")
         return project
     
@@ -311,7 +561,9 @@ class ProjectStateService:
         if not checkpoints_dir.exists():
             return []
         
-        return [f.stem for f in checkpoints_dir.glob("*.json")]
+        names = {f.name[:-len(".json.gz")] for f in checkpoints_dir.glob("*.json.gz")}
+        names.update(f.stem for f in checkpoints_dir.glob("*.json"))
+        return sorted(names)
     
     def delete_project(self, project_id: str) -> bool:
         """Delete a project and all its data.
@@ -322,11 +574,21 @@ class ProjectStateService:
         Returns:
             True if deleted, False if not found
         """
-        project_dir = self._get_project_dir(project_id)
-        if not project_dir.exists():
-            return False
-        
-        import shutil
-        shutil.rmtree(project_dir)
+        with self._write_lock:
+            # Tombstone first so a flush already holding this project skips it
+            # instead of recreating the directory and manifest row.
+            if self._flushing:
+                self._deleted.add(project_id)
+            self._pending.pop(project_id, None)
+            self._inflight.pop(project_id, None)
+            with self._cache_lock:
+                self._cache.pop(project_id, None)
+            project_dir = self._get_project_dir(project_id)
+            if not project_dir.exists():
+                return False
+            
+            import shutil
+            shutil.rmtree(project_dir)
+            self._update_manifest(project_id, None)
         logger.info(f"Deleted project {project_id}")
         return True
@@ -1,7 +1,13 @@
 import asyncio
+import functools
 import os
 import json
-from typing import TypedDict, List, Annotated
+import logging
+import logging.handlers
+import queue
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Mapping, TypedDict, List, Annotated
 from dotenv import load_dotenv
 
 # SpoonOS Core Imports
@@ -14,6 +20,21 @@ from spoon_ai.tools.tool_manager import ToolManager
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger("copilot.bf")
+
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Send node progress logs through a queue so one thread does all writes."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("\n%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
 # ==========================================
 # 1. DEFINING THE SHARED STATE (Memory)
 # ==========================================
@@ -28,32 +49,66 @@ class BehavioralFinanceState(TypedDict):
 # 2. DEFINING THE NODES (The Agents)
 # ==========================================
 
+def async_ttl_cache(ttl: float, key: Callable[[Any], Hashable] = lambda state: state['token']):
+    """Cache an async node's result per key for `ttl` seconds.
+
+    Market and narrative lookups are the calls that will hit real APIs, so a
+    repeated token within the TTL skips the round-trip. `cache_clear()` on the
+    wrapped function drops all entries.
+    """
+    def decorator(fn):
+        entries = {}
+        lock = asyncio.Lock()
+
+        @functools.wraps(fn)
+        async def wrapper(state):
+            cache_key = key(state)
+            async with lock:
+                hit = entries.get(cache_key)
+                if hit is not None and hit[0] > time.monotonic():
+                    return hit[1]
+            result = await fn(state)
+            async with lock:
+                entries[cache_key] = (time.monotonic() + ttl, result)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+@async_ttl_cache(ttl=30)
 async def analyze_market_reality(state: BehavioralFinanceState):
     """
     NODE 1: ONCHAIN DATA SCOUT
     Uses web search to find market data and price information.
     """
-    print(f"\n📉 [Market Agent] Fetching real-time market data for {state['token']}...")
+    token = state['token']
+    logger.info("📉 [Market Agent] Fetching real-time market data for %s...", token)
 
     # For demo purposes, use simulated market data
     # In production, you would integrate with actual crypto APIs
+    token_hash = hash(token)
     market_data = {
-        "price": f"${(3000 + hash(state['token']) % 1000):.2f}",
-        "change_24h": f"{-5 + (hash(state['token']) % 20):.2f}%",
-        "volume_24h": f"{(100 + hash(state['token']) % 500):.2f}M",
-        "summary": f"Current market data for {state['token']}: Price data shows moderate volatility with typical trading volume."
+        "price": f"${(3000 + token_hash % 1000):.2f}",
+        "change_24h": f"{-5 + (token_hash % 20):.2f}%",
+        "volume_24h": f"{(100 + token_hash % 500):.2f}M",
+        "summary": f"Current market data for {token}: Price data shows moderate volatility with typical trading volume."
     }
 
     # Store market data
     return {"market_condition": market_data}
 
 
+@async_ttl_cache(ttl=300, key=lambda state: (state['token'], state['market_condition'].get('change_24h')))
 async def analyze_narrative_context(state: BehavioralFinanceState):
     """
     NODE 2: OFFCHAIN NARRATIVE ANALYST
     Analyzes market sentiment and news narratives.
     """
-    print(f"\n🗞️ [Narrative Agent] determining sentiment for {state['token']}...")
+    token = state['token']
+    market = state['market_condition']
+    logger.info("🗞️ [Narrative Agent] determining sentiment for %s...", token)
 
     # For demo purposes, use simulated narrative analysis
     # In production, you would use actual news search tools
@@ -64,7 +119,7 @@ async def analyze_narrative_context(state: BehavioralFinanceState):
     ]
 
     # Use market data to influence narrative choice
-    market_change = float(state['market_condition']['change_24h'].replace('%', ''))
+    market_change = float(market['change_24h'].replace('%', ''))
     if market_change > 5:
         narrative = narratives[0]  # HYPE
     elif market_change < -5:
@@ -75,12 +130,26 @@ async def analyze_narrative_context(state: BehavioralFinanceState):
     return {"narrative_context": narrative}
 
 
+# Canonical persona reactions. The simulator only ever produces these, so
+# nodes return shared read-only references instead of building fresh dicts.
+_PANIC_SELL = MappingProxyType({"action": "Sell", "reason": "Market panic due to negative sentiment"})
+_DIP_BUY = MappingProxyType({"action": "Buy", "reason": "Buying the dip on oversold conditions"})
+_FOMO_BUY = MappingProxyType({"action": "Buy", "reason": "FOMO from positive news"})
+_PROFIT_HOLD = MappingProxyType({"action": "Hold", "reason": "Taking profits, waiting for better entry"})
+_UNCERTAIN_HOLD = MappingProxyType({"action": "Hold", "reason": "Uncertainty causing inaction"})
+_CONSOLIDATION_HOLD = MappingProxyType({"action": "Hold", "reason": "Market consolidation, waiting for signals"})
+
+_FEAR_RESULTS = MappingProxyType({"Persona_A": _PANIC_SELL, "Persona_B": _DIP_BUY})
+_GREED_RESULTS = MappingProxyType({"Persona_A": _FOMO_BUY, "Persona_B": _PROFIT_HOLD})
+_NEUTRAL_RESULTS = MappingProxyType({"Persona_A": _UNCERTAIN_HOLD, "Persona_B": _CONSOLIDATION_HOLD})
+
+
 async def run_trader_simulation(state: BehavioralFinanceState):
     """
     NODE 3: SYNTHETIC PARTICIPANT SIMULATOR
     Simulates two trader personas reacting to the data found in previous steps.
     """
-    print(f"\n🤖 [Simulator] Running Agent Simulation (Panic vs. Smart Money)...")
+    logger.info("🤖 [Simulator] Running Agent Simulation (Panic vs. Smart Money)...")
 
     # For demo purposes, simulate without LLM to avoid API key requirements
     # In production, you would use an LLM for more sophisticated simulation
@@ -90,44 +159,47 @@ async def run_trader_simulation(state: BehavioralFinanceState):
 
     # Simulate trader behavior based on market conditions and narrative
     if "FUD" in narrative or market_change < -5:
-        panic_action = {"action": "Sell", "reason": "Market panic due to negative sentiment"}
-        smart_action = {"action": "Buy", "reason": "Buying the dip on oversold conditions"}
+        sim_data = _FEAR_RESULTS
     elif "HYPE" in narrative or market_change > 5:
-        panic_action = {"action": "Buy", "reason": "FOMO from positive news"}
-        smart_action = {"action": "Hold", "reason": "Taking profits, waiting for better entry"}
+        sim_data = _GREED_RESULTS
     else:
-        panic_action = {"action": "Hold", "reason": "Uncertainty causing inaction"}
-        smart_action = {"action": "Hold", "reason": "Market consolidation, waiting for signals"}
-
-    sim_data = {
-        "Persona_A": panic_action,
-        "Persona_B": smart_action
-    }
+        sim_data = _NEUTRAL_RESULTS
 
     return {"simulation_results": sim_data}
 
 
+_VERDICT_TEMPLATE = """
+    HYPOTHESIS TEST REPORT:
+    Based on real-time data, the narrative was identified as: {narrative}...
+
+    Simulation Behavior:
+    - Panic Seller: {persona_a}
+    - Smart Money: {persona_b}
+
+    Conclusion:
+    This {conclusion} the hypothesis that current market conditions are driving panic behavior.
+    """
+
+
 async def validate_hypothesis(state: BehavioralFinanceState):
     """
     NODE 4: HYPOTHESIS CHECKER
     """
-    print(f"\n⚖️ [Research Lead] Validating Hypothesis...")
+    logger.info("⚖️ [Research Lead] Validating Hypothesis...")
 
     sim = state['simulation_results']
-    news = state['narrative_context']
+    news_excerpt = state['narrative_context'][:50]
+    persona_a = sim['Persona_A']['action']
+    persona_b = sim['Persona_B']['action']
 
     # Simple logic to generate verdict
-    verdict = f"""
-    HYPOTHESIS TEST REPORT:
-    Based on real-time data, the narrative was identified as: {news[:50]}...
-
-    Simulation Behavior:
-    - Panic Seller: {sim.get('Persona_A', {}).get('action')}
-    - Smart Money: {sim.get('Persona_B', {}).get('action')}
-
-    Conclusion:
-    This {'SUPPORTS' if 'Sell' in str(sim) else 'REJECTS'} the hypothesis that current market conditions are driving panic behavior.
-    """
+    supports = any(p.get('action') == 'Sell' for p in sim.values())
+    verdict = _VERDICT_TEMPLATE.format(
+        narrative=news_excerpt,
+        persona_a=persona_a,
+        persona_b=persona_b,
+        conclusion='SUPPORTS' if supports else 'REJECTS',
+    )
 
     return {"hypothesis_verdict": verdict}
 
@@ -136,7 +208,9 @@ async def validate_hypothesis(state: BehavioralFinanceState):
 # 3. BUILDING THE GRAPH
 # ==========================================
 
-async def main():
+@functools.cache
+def _build_app():
+    """Build and compile the analysis graph once; its shape never changes."""
     # 1. Initialize Graph
     workflow = StateGraph(BehavioralFinanceState)
 
@@ -155,25 +229,50 @@ async def main():
     workflow.set_entry_point("get_market_data")
 
     # 5. Compile
-    app = workflow.compile()
+    return workflow.compile()
+
+
+_INITIAL_STATE: BehavioralFinanceState = {
+    "token": "",
+    "market_condition": {},
+    "narrative_context": "",
+    "simulation_results": {},
+    "hypothesis_verdict": ""
+}
+
+
+def _initial_state(token: str) -> BehavioralFinanceState:
+    """Seed a run from the fixed-shape template; nested dicts are never shared."""
+    state = _INITIAL_STATE.copy()
+    state["token"] = token
+    state["market_condition"] = {}
+    state["simulation_results"] = {}
+    return state
+
+
+async def run_batch(tokens: List[str]) -> List[BehavioralFinanceState]:
+    """Run the analysis graph for several tokens, reusing one compiled app."""
+    app = _build_app()
+    return list(await asyncio.gather(*(app.invoke(_initial_state(token)) for token in tokens)))
+
+
+async def main():
+    app = _build_app()
 
     # 6. Execution
     target_token = "ETH"
     print(f"🚀 Starting Behavioral Finance Study on: {target_token}")
 
-    result = await app.invoke({
-        "token": target_token,
-        "market_condition": {},
-        "narrative_context": "",
-        "simulation_results": {},
-        "hypothesis_verdict": ""
-    })
+    result = await app.invoke(_initial_state(target_token))
 
     print("\n" + "="*60)
     print(result["hypothesis_verdict"])
     print("="*60)
-    print("Full Simulation Detail:", json.dumps(result["simulation_results"], indent=2))
+    print("Full Simulation Detail:", json.dumps(result["simulation_results"], indent=2, default=dict))
 
 if __name__ == "__main__":
-
-    asyncio.run(main())
\ No newline at end of file
+    listener = _configure_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
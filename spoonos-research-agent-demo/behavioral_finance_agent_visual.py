@@ -1,12 +1,19 @@
 import asyncio
+import functools
 import os
 import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from types import MappingProxyType
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import seaborn as sns
 import numpy as np
 from datetime import datetime
-from typing import TypedDict, List, Annotated
+from typing import Any, Callable, Hashable, Mapping, TypedDict, List, Annotated
 from dotenv import load_dotenv
 
 # SpoonOS Core Imports
@@ -19,6 +26,21 @@ from spoon_ai.tools.tool_manager import ToolManager
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger("copilot.bf")
+
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Send node progress logs through a queue so one thread does all writes."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("\n%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
 # Configure matplotlib for non-interactive backend
 plt.switch_backend('Agg')
 sns.set_style("whitegrid")
@@ -36,20 +58,34 @@ class BehavioralFinanceState(TypedDict):
     hypothesis_verdict: str     # Conclusion
     execution_timestamp: str    # When analysis was run
 
+
+def _json_default(value):
+    """Serialise read-only simulation mappings as objects, anything else as text."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
 # ==========================================
 # 2. VISUALIZATION MODULE
 # ==========================================
 class BehavioralFinanceVisualizer:
     """Creates comprehensive visualizations for behavioral finance analysis"""
 
+    # pyplot keeps global figure state, so only one dashboard renders at a time
+    _render_lock = threading.Lock()
+
     def __init__(self, output_dir: str = "behavioral_finance_output"):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    def create_comprehensive_dashboard(self, state: BehavioralFinanceState):
+    def create_comprehensive_dashboard(self, state: BehavioralFinanceState, timestamp: str = None):
         """Create a multi-panel dashboard showing all analysis aspects"""
+        with self._render_lock:
+            return self._render_dashboard(state, timestamp or self.timestamp)
 
+    def _render_dashboard(self, state: BehavioralFinanceState, timestamp: str):
         fig = plt.figure(figsize=(16, 12))
         fig.suptitle(f'Behavioral Finance Analysis: {state["token"]} - {state["execution_timestamp"]}',
                      fontsize=16, fontweight='bold')
@@ -77,7 +113,7 @@ class BehavioralFinanceVisualizer:
         plt.tight_layout()
 
         # Save the dashboard
-        dashboard_path = os.path.join(self.output_dir, f'behavioral_finance_dashboard_{self.timestamp}.png')
+        dashboard_path = os.path.join(self.output_dir, f'behavioral_finance_dashboard_{timestamp}.png')
         plt.savefig(dashboard_path, dpi=300, bbox_inches='tight')
         plt.close()
 
@@ -269,12 +305,12 @@ class BehavioralFinanceVisualizer:
         ax.set_aspect('equal')
         ax.axis('off')
 
-    def save_analysis_data(self, state: BehavioralFinanceState):
+    def save_analysis_data(self, state: BehavioralFinanceState, timestamp: str = None):
         """Save analysis data to JSON file"""
-        data_path = os.path.join(self.output_dir, f'analysis_data_{self.timestamp}.json')
+        data_path = os.path.join(self.output_dir, f'analysis_data_{timestamp or self.timestamp}.json')
 
         with open(data_path, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
+            json.dump(state, f, indent=2, default=_json_default)
 
         return data_path
 
@@ -284,32 +320,67 @@ class BehavioralFinanceVisualizer:
 
 visualizer = BehavioralFinanceVisualizer()
 
+
+def async_ttl_cache(ttl: float, key: Callable[[Any], Hashable] = lambda state: state['token']):
+    """Cache an async node's result per key for `ttl` seconds.
+
+    Market and narrative lookups are the calls that will hit real APIs, so a
+    repeated token within the TTL skips the round-trip. `cache_clear()` on the
+    wrapped function drops all entries.
+    """
+    def decorator(fn):
+        entries = {}
+        lock = asyncio.Lock()
+
+        @functools.wraps(fn)
+        async def wrapper(state):
+            cache_key = key(state)
+            async with lock:
+                hit = entries.get(cache_key)
+                if hit is not None and hit[0] > time.monotonic():
+                    return hit[1]
+            result = await fn(state)
+            async with lock:
+                entries[cache_key] = (time.monotonic() + ttl, result)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+@async_ttl_cache(ttl=30)
 async def analyze_market_reality(state: BehavioralFinanceState):
     """
     NODE 1: ONCHAIN DATA SCOUT
     Uses web search to find market data and price information.
     """
-    print(f"\n📉 [Market Agent] Fetching real-time market data for {state['token']}...")
+    token = state['token']
+    logger.info("📉 [Market Agent] Fetching real-time market data for %s...", token)
 
     # For demo purposes, use simulated market data
     # In production, you would integrate with actual crypto APIs
+    token_hash = hash(token)
     market_data = {
-        "price": f"${(3000 + hash(state['token']) % 1000):.2f}",
-        "change_24h": f"{-5 + (hash(state['token']) % 20):.2f}%",
-        "volume_24h": f"{(100 + hash(state['token']) % 500):.2f}M",
-        "summary": f"Current market data for {state['token']}: Price data shows moderate volatility with typical trading volume."
+        "price": f"${(3000 + token_hash % 1000):.2f}",
+        "change_24h": f"{-5 + (token_hash % 20):.2f}%",
+        "volume_24h": f"{(100 + token_hash % 500):.2f}M",
+        "summary": f"Current market data for {token}: Price data shows moderate volatility with typical trading volume."
     }
 
     # Store market data
     return {"market_condition": market_data}
 
 
+@async_ttl_cache(ttl=300, key=lambda state: (state['token'], state['market_condition'].get('change_24h')))
 async def analyze_narrative_context(state: BehavioralFinanceState):
     """
     NODE 2: OFFCHAIN NARRATIVE ANALYST
     Analyzes market sentiment and news narratives.
     """
-    print(f"\n🗞️ [Narrative Agent] determining sentiment for {state['token']}...")
+    token = state['token']
+    market = state['market_condition']
+    logger.info("🗞️ [Narrative Agent] determining sentiment for %s...", token)
 
     # For demo purposes, use simulated narrative analysis
     # In production, you would use actual news search tools
@@ -320,7 +391,7 @@ async def analyze_narrative_context(state: BehavioralFinanceState):
     ]
 
     # Use market data to influence narrative choice
-    market_change = float(state['market_condition']['change_24h'].replace('%', ''))
+    market_change = float(market['change_24h'].replace('%', ''))
     if market_change > 5:
         narrative = narratives[0]  # HYPE
     elif market_change < -5:
@@ -331,12 +402,26 @@ async def analyze_narrative_context(state: BehavioralFinanceState):
     return {"narrative_context": narrative}
 
 
+# Canonical persona reactions. The simulator only ever produces these, so
+# nodes return shared read-only references instead of building fresh dicts.
+_PANIC_SELL = MappingProxyType({"action": "Sell", "reason": "Market panic due to negative sentiment"})
+_DIP_BUY = MappingProxyType({"action": "Buy", "reason": "Buying the dip on oversold conditions"})
+_FOMO_BUY = MappingProxyType({"action": "Buy", "reason": "FOMO from positive news"})
+_PROFIT_HOLD = MappingProxyType({"action": "Hold", "reason": "Taking profits, waiting for better entry"})
+_UNCERTAIN_HOLD = MappingProxyType({"action": "Hold", "reason": "Uncertainty causing inaction"})
+_CONSOLIDATION_HOLD = MappingProxyType({"action": "Hold", "reason": "Market consolidation, waiting for signals"})
+
+_FEAR_RESULTS = MappingProxyType({"Persona_A": _PANIC_SELL, "Persona_B": _DIP_BUY})
+_GREED_RESULTS = MappingProxyType({"Persona_A": _FOMO_BUY, "Persona_B": _PROFIT_HOLD})
+_NEUTRAL_RESULTS = MappingProxyType({"Persona_A": _UNCERTAIN_HOLD, "Persona_B": _CONSOLIDATION_HOLD})
+
+
 async def run_trader_simulation(state: BehavioralFinanceState):
     """
     NODE 3: SYNTHETIC PARTICIPANT SIMULATOR
     Simulates two trader personas reacting to the data found in previous steps.
     """
-    print(f"\n🤖 [Simulator] Running Agent Simulation (Panic vs. Smart Money)...")
+    logger.info("🤖 [Simulator] Running Agent Simulation (Panic vs. Smart Money)...")
 
     # For demo purposes, simulate without LLM to avoid API key requirements
     # In production, you would use an LLM for more sophisticated simulation
@@ -346,45 +431,84 @@ async def run_trader_simulation(state: BehavioralFinanceState):
 
     # Simulate trader behavior based on market conditions and narrative
     if "FUD" in narrative or market_change < -5:
-        panic_action = {"action": "Sell", "reason": "Market panic due to negative sentiment"}
-        smart_action = {"action": "Buy", "reason": "Buying the dip on oversold conditions"}
+        sim_data = _FEAR_RESULTS
     elif "HYPE" in narrative or market_change > 5:
-        panic_action = {"action": "Buy", "reason": "FOMO from positive news"}
-        smart_action = {"action": "Hold", "reason": "Taking profits, waiting for better entry"}
+        sim_data = _GREED_RESULTS
     else:
-        panic_action = {"action": "Hold", "reason": "Uncertainty causing inaction"}
-        smart_action = {"action": "Hold", "reason": "Market consolidation, waiting for signals"}
-
-    sim_data = {
-        "Persona_A": panic_action,
-        "Persona_B": smart_action
-    }
+        sim_data = _NEUTRAL_RESULTS
 
     return {"simulation_results": sim_data}
 
 
-async def validate_hypothesis(state: BehavioralFinanceState):
-    """
-    NODE 4: HYPOTHESIS CHECKER
+# Narrative labels and 24h-change buckets used by the batch simulator
+NARRATIVE_LABELS = ("FUD", "HYPE", "NEUTRAL")
+_CHANGE_DOWN, _CHANGE_UP, _CHANGE_FLAT = 0, 1, 2
+
+# (narrative label, change bucket) -> scenario, mirroring the if/elif order in
+# run_trader_simulation: FUD or a drop wins, then HYPE or a rise, else neutral
+_ACTION_TABLE = np.array([
+    [0, 0, 0],  # FUD
+    [0, 1, 1],  # HYPE
+    [0, 1, 2],  # NEUTRAL
+], dtype=np.int8)
+
+# Scenario -> simulation_results, indexed by the values in _ACTION_TABLE
+_SCENARIO_RESULTS = (_FEAR_RESULTS, _GREED_RESULTS, _NEUTRAL_RESULTS)
+
+
+def run_trader_simulation_batch(changes: np.ndarray, labels: np.ndarray) -> List[Mapping]:
+    """Simulate both personas for many tokens at once.
+
+    Args:
+        changes: 24h price change in percent, one per token
+        labels: Index into NARRATIVE_LABELS, one per token
+
+    Returns:
+        One read-only simulation_results mapping per token, shared with
+        run_trader_simulation
     """
-    print(f"\n⚖️ [Research Lead] Validating Hypothesis...")
+    changes = np.asarray(changes, dtype=float)
+    buckets = np.full(changes.shape, _CHANGE_FLAT, dtype=np.int8)
+    buckets[changes > 5] = _CHANGE_UP
+    buckets[changes < -5] = _CHANGE_DOWN
+    scenarios = _ACTION_TABLE[np.asarray(labels, dtype=np.intp), buckets]
 
-    sim = state['simulation_results']
-    news = state['narrative_context']
+    return [_SCENARIO_RESULTS[scenario] for scenario in scenarios.tolist()]
 
-    # Simple logic to generate verdict
-    verdict = f"""
+
+_VERDICT_TEMPLATE = """
     HYPOTHESIS TEST REPORT:
-    Based on real-time data, the narrative was identified as: {news[:50]}...
+    Based on real-time data, the narrative was identified as: {narrative}...
 
     Simulation Behavior:
-    - Panic Seller: {sim.get('Persona_A', {}).get('action')}
-    - Smart Money: {sim.get('Persona_B', {}).get('action')}
+    - Panic Seller: {persona_a}
+    - Smart Money: {persona_b}
 
     Conclusion:
-    This {'SUPPORTS' if 'Sell' in str(sim) else 'REJECTS'} the hypothesis that current market conditions are driving panic behavior.
+    This {conclusion} the hypothesis that current market conditions are driving panic behavior.
     """
 
+
+async def validate_hypothesis(state: BehavioralFinanceState):
+    """
+    NODE 4: HYPOTHESIS CHECKER
+    """
+    logger.info("⚖️ [Research Lead] Validating Hypothesis...")
+
+    sim = state['simulation_results']
+    news_excerpt = state['narrative_context'][:50]
+    persona_a = sim['Persona_A']['action']
+    persona_b = sim['Persona_B']['action']
+
+    # Simple logic to generate verdict
+    supports = any(p.get('action') == 'Sell' for p in sim.values())
+    verdict = _VERDICT_TEMPLATE.format(
+        narrative=news_excerpt,
+        persona_a=persona_a,
+        persona_b=persona_b,
+        conclusion='SUPPORTS' if supports else 'REJECTS',
+    )
+
     return {"hypothesis_verdict": verdict}
 
 
@@ -392,7 +516,9 @@ async def validate_hypothesis(state: BehavioralFinanceState):
 # 4. BUILDING THE GRAPH
 # ==========================================
 
-async def main():
+@functools.cache
+def _build_app():
+    """Build and compile the analysis graph once; its shape never changes."""
     # 1. Initialize Graph
     workflow = StateGraph(BehavioralFinanceState)
 
@@ -411,45 +537,76 @@ async def main():
     workflow.set_entry_point("get_market_data")
 
     # 5. Compile
-    app = workflow.compile()
+    return workflow.compile()
+
+
+_INITIAL_STATE: BehavioralFinanceState = {
+    "token": "",
+    "market_condition": {},
+    "narrative_context": "",
+    "simulation_results": {},
+    "hypothesis_verdict": "",
+    "execution_timestamp": ""
+}
+
+
+def _initial_state(token: str, timestamp: str) -> BehavioralFinanceState:
+    """Seed a run from the fixed-shape template; nested dicts are never shared."""
+    state = _INITIAL_STATE.copy()
+    state["token"] = token
+    state["execution_timestamp"] = timestamp
+    state["market_condition"] = {}
+    state["simulation_results"] = {}
+    return state
+
+
+async def run_batch(tokens: List[str]) -> List[BehavioralFinanceState]:
+    """Run the analysis graph for several tokens, reusing one compiled app."""
+    app = _build_app()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return list(await asyncio.gather(*(app.invoke(_initial_state(token, timestamp)) for token in tokens)))
+
+
+async def main():
+    app = _build_app()
 
     # 6. Execution
     target_token = "ETH"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # One clock read per run, shared by the console output and file names
+    started = datetime.now()
+    timestamp = started.strftime("%Y-%m-%d %H:%M:%S")
+    file_stamp = started.strftime("%Y%m%d_%H%M%S")
     print(f"🚀 Starting Behavioral Finance Study on: {target_token}")
     print(f"📅 Timestamp: {timestamp}")
 
-    result = await app.invoke({
-        "token": target_token,
-        "market_condition": {},
-        "narrative_context": "",
-        "simulation_results": {},
-        "hypothesis_verdict": "",
-        "execution_timestamp": timestamp
-    })
+    result = await app.invoke(_initial_state(target_token, timestamp))
 
     # Print results
     print("\n" + "="*60)
     print(result["hypothesis_verdict"])
     print("="*60)
-    print("Full Simulation Detail:", json.dumps(result["simulation_results"], indent=2))
+    print("Full Simulation Detail:", json.dumps(result["simulation_results"], indent=2, default=dict))
 
     # Generate visualizations
     print(f"\n📊 Generating visualizations...")
 
-    # Create comprehensive dashboard
-    dashboard_path = visualizer.create_comprehensive_dashboard(result)
+    # Render the dashboard and write the JSON off the event loop thread
+    dashboard_path, data_path = await asyncio.gather(
+        asyncio.to_thread(visualizer.create_comprehensive_dashboard, result, file_stamp),
+        asyncio.to_thread(visualizer.save_analysis_data, result, file_stamp),
+    )
     print(f"📈 Dashboard saved: {dashboard_path}")
-
-    # Save analysis data
-    data_path = visualizer.save_analysis_data(result)
     print(f"💾 Analysis data saved: {data_path}")
 
     # Print output summary
     output_dir = visualizer.output_dir
     print(f"\n📁 All outputs saved to: {output_dir}/")
-    print(f"   - Dashboard: behavioral_finance_dashboard_{visualizer.timestamp}.png")
-    print(f"   - Data: analysis_data_{visualizer.timestamp}.json")
+    print(f"   - Dashboard: behavioral_finance_dashboard_{file_stamp}.png")
+    print(f"   - Data: analysis_data_{file_stamp}.json")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    listener = _configure_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
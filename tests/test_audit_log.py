@@ -0,0 +1,47 @@
+"""Tests for the column-oriented ``AuditLog`` runtime container."""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from copilot_workflow.schemas import AuditEntry, AuditLog, ProjectState, ProjectStateRT
+
+
+def test_aware_timestamp_round_trip():
+    state = ProjectState(
+        audit_log=[{"timestamp": "2024-01-01T00:00:00Z", "message": "ingested"}]
+    )
+    runtime = ProjectStateRT.from_model(state)
+    restored = runtime.to_model()
+
+    assert len(restored.audit_log) == 1
+    entry = restored.audit_log[0]
+    assert entry.message == "ingested"
+    assert entry.timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_naive_timestamp_is_taken_as_utc():
+    log = AuditLog([AuditEntry(message="m", timestamp=datetime(2024, 5, 6, 7, 8, 9, 123456))])
+    assert log[0].timestamp == datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+
+
+def test_record_and_slice():
+    log = AuditLog()
+    log.record("warning", "first", location="rq")
+    log.record("info", "second")
+
+    assert len(log) == 2
+    assert [e.message for e in log[-1:]] == ["second"]
+    assert log[0].level == "warning"
+    assert log[0].location == "rq"
+    assert log[0].timestamp.tzinfo is not None
+
+
+def test_default_timestamps_are_aware_utc():
+    entry = AuditEntry(message="m")
+    assert entry.timestamp.tzinfo is timezone.utc
+    assert AuditLog([entry])[0].timestamp == entry.timestamp
@@ -0,0 +1,107 @@
+"""Tests for the SerpAPI Google Scholar client: retries, caching and dedupe."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+COPILOT_DIR = ROOT / "research_copilot"
+if str(COPILOT_DIR) not in sys.path:
+    sys.path.insert(0, str(COPILOT_DIR))
+
+from modules import google_scholar_search as gs
+
+
+def _result(title, link, year="2020"):
+    return {
+        "title": title,
+        "link": link,
+        "snippet": "",
+        "publication_info": {"summary": f"A Author - Journal, {year}"},
+    }
+
+
+@pytest.fixture
+def serpapi(tmp_path, monkeypatch):
+    """Route SerpAPI requests to ``serpapi.handler`` and isolate the cache."""
+    monkeypatch.setattr(gs, "CACHE_DIR", tmp_path / "serpapi")
+    monkeypatch.setattr(gs, "_mem_cache", {})
+    monkeypatch.setattr(gs, "_retry_delay", lambda attempt, retry_after: 0)
+
+    class Server:
+        requests = []
+        handler = None
+
+    def transport(request):
+        Server.requests.append(request)
+        return Server.handler(request)
+
+    def install():
+        loop = asyncio.get_running_loop()
+        gs._clients[loop] = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+
+    Server.install = staticmethod(install)
+    yield Server
+    gs._clients.clear()
+
+
+async def test_fetch_retries_rate_limits(serpapi):
+    serpapi.install()
+    statuses = iter([429, 503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        body = {"organic_results": []} if status == 200 else {}
+        return httpx.Response(status, json=body, headers={"Retry-After": "0"})
+
+    serpapi.handler = handler
+    assert await gs._fetch({"q": "stress"}) == {"organic_results": []}
+    assert len(serpapi.requests) == 3
+
+
+async def test_fetch_gives_up_on_client_errors(serpapi):
+    serpapi.install()
+    serpapi.handler = lambda request: httpx.Response(400, json={})
+    assert await gs._fetch({"q": "stress"}) is None
+    assert len(serpapi.requests) == 1
+
+
+async def test_search_results_are_cached(serpapi):
+    serpapi.install()
+    serpapi.handler = lambda request: httpx.Response(
+        200, json={"organic_results": [_result("Stress and sleep", "https://x.org/a")]}
+    )
+
+    first = await gs.search_google_scholar("stress sleep", num_results=5)
+    assert first[0]["title"] == "Stress and sleep"
+    assert first[0]["year"] == "2020"
+
+    # Memory hit, then disk hit from a cold process cache
+    assert await gs.search_google_scholar("stress sleep", num_results=5) == first
+    gs._mem_cache.clear()
+    assert await gs.search_google_scholar("stress sleep", num_results=5) == first
+    assert len(serpapi.requests) == 1
+    assert [p.name for p in gs.CACHE_DIR.iterdir()] == [
+        f"{gs._cache_key('stress sleep', 5, None, None)}.json"
+    ]
+
+
+async def test_search_multiple_queries_dedupes_papers(serpapi):
+    serpapi.install()
+    serpapi.handler = lambda request: httpx.Response(200, json={"organic_results": [
+        _result("Shared paper", "https://x.org/shared/"),
+        _result(f"Only for {request.url.params['q']}", ""),
+    ]})
+
+    combined = await gs.search_multiple_queries(["stress", "sleep"], papers_per_query=5)
+    titles = [p["title"] for p in combined["papers"]]
+    assert titles == ["Shared paper", "Only for stress", "Only for sleep"]
+    assert len(combined["citations"]) == 3
+
+
+def test_paper_key_normalizes_urls_and_titles():
+    assert gs._paper_key({"url": "https://X.org/a/#frag"}) == gs._paper_key({"url": "https://x.org/a"})
+    assert gs._paper_key({"title": "Stress  And Sleep"}) == gs._paper_key({"title": "stress and sleep"})
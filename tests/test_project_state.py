@@ -0,0 +1,67 @@
+"""Tests for the ``ProjectState`` concept graph fields and their legacy shape."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from copilot_workflow.schemas import ConceptEdge, ConceptNode, ProjectState, ProjectStateRT
+
+
+def _graph():
+    nodes = [
+        ConceptNode(id="c1", label="Anxiety", type="theoretical_construct"),
+        ConceptNode(id="c2", label="Attention", type="outcome"),
+    ]
+    edges = [ConceptEdge(source="c1", target="c2", relation_type="predicts")]
+    return nodes, edges
+
+
+def test_legacy_concepts_input_is_split():
+    nodes, edges = _graph()
+    state = ProjectState(concepts={"nodes": nodes, "edges": edges})
+    assert state.concept_nodes == nodes
+    assert state.concept_edges == edges
+    assert state.concepts["nodes"] == nodes
+    assert state.concepts["edges"] == edges
+
+
+def test_concepts_setter_replaces_both_fields():
+    nodes, edges = _graph()
+    state = ProjectState()
+    state.concepts = {"nodes": nodes, "edges": edges}
+    assert state.concept_nodes == nodes
+    assert state.concept_edges == edges
+
+    state.concepts = {"nodes": []}
+    assert state.concept_nodes == []
+    assert state.concept_edges == []
+
+
+def test_dump_keeps_legacy_concepts_shape():
+    nodes, edges = _graph()
+    state = ProjectState(concept_nodes=nodes, concept_edges=edges)
+    data = state.model_dump()
+
+    assert "concept_nodes" not in data and "concept_edges" not in data
+    assert [n["id"] for n in data["concepts"]["nodes"]] == ["c1", "c2"]
+    assert data["concepts"]["edges"][0]["source"] == "c1"
+    assert list(data).index("concepts") == list(data).index("papers") + 1
+
+
+def test_json_round_trip():
+    nodes, edges = _graph()
+    state = ProjectState(concept_nodes=nodes, concept_edges=edges)
+    restored = ProjectState.model_validate_json(state.model_dump_json())
+    assert restored.concept_nodes == nodes
+    assert restored.concept_edges == edges
+
+
+def test_runtime_round_trip_preserves_graph():
+    nodes, edges = _graph()
+    state = ProjectState(concepts={"nodes": nodes, "edges": edges})
+    restored = ProjectStateRT.from_model(state).to_model()
+    assert restored.concepts["nodes"] == nodes
+    assert restored.concepts["edges"] == edges
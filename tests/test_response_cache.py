@@ -0,0 +1,38 @@
+"""Tests for the SQLite-backed parsed-response cache."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from copilot_workflow.response_cache import ResponseCache, cache_key
+
+
+def test_cache_key_is_stable_and_model_specific():
+    assert cache_key("openai", "prompt") == cache_key("openai", "prompt")
+    assert cache_key("openai", "prompt") != cache_key("anthropic", "prompt")
+
+
+def test_get_set_and_stats(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert cache.get("k") is None
+
+    cache.set("k", {"constructs": ["stress"]})
+    assert cache.get("k") == {"constructs": ["stress"]}
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    cache.set("stale", [1, 2], expire=-1)
+    assert cache.get("stale") is None
+
+    cache.set("stale", [3], expire=60)
+    assert cache.get("stale") == [3]
+
+
+def test_entries_persist_across_instances(tmp_path):
+    ResponseCache(tmp_path / "cache.sqlite").set("k", "v")
+    assert ResponseCache(tmp_path / "cache.sqlite").get("k") == "v"
@@ -0,0 +1,168 @@
+"""Tests for ``ProjectStateService`` persistence: write-behind, manifest, checkpoints."""
+
+import asyncio
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+# state_service imports its siblings by bare name, as when api.py runs
+ROOT = Path(__file__).resolve().parent.parent
+COPILOT_DIR = ROOT / "research_copilot"
+if str(COPILOT_DIR) not in sys.path:
+    sys.path.insert(0, str(COPILOT_DIR))
+
+from state_service import ProjectStateService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ProjectStateService(str(tmp_path / "projects"))
+
+
+def test_save_and_load_round_trip(service):
+    project = service.create_project("Sleep study", "Does sleep affect memory?")
+
+    loaded = service.load_project(project.id)
+    assert loaded is not project
+    assert loaded.name == "Sleep study"
+    assert loaded.research_question.raw_text == "Does sleep affect memory?"
+
+    # Every load returns an independent object
+    loaded.name = "changed"
+    assert service.load_project(project.id).name == "Sleep study"
+
+
+def test_load_missing_project_returns_none(service):
+    assert service.load_project("missing") is None
+
+
+def test_manifest_tracks_saves_and_deletes(service):
+    first = service.create_project("First", "q1")
+    second = service.create_project("Second", "q2")
+    second.name = "Second (renamed)"
+    service.save_project(second)
+
+    listed = service.list_projects()
+    assert [p["id"] for p in listed] == [second.id, first.id]
+    assert listed[0]["name"] == "Second (renamed)"
+    assert set(listed[0]) == set(ProjectStateService._MANIFEST_FIELDS)
+
+    assert service.delete_project(first.id)
+    assert [p["id"] for p in service.list_projects()] == [second.id]
+    assert not service.delete_project(first.id)
+
+
+def test_manifest_rebuilt_when_missing(service):
+    project = service.create_project("Rebuilt", "q")
+    service._get_manifest_file().unlink()
+
+    fresh = ProjectStateService(str(service.storage_dir))
+    assert [p["id"] for p in fresh.list_projects()] == [project.id]
+    assert fresh._get_manifest_file().exists()
+
+
+def test_manifest_rebuild_skips_unreadable_and_tolerates_old_states(service):
+    project = service.create_project("Good", "q")
+    service._get_manifest_file().unlink()
+
+    corrupt = service.storage_dir / "corrupt"
+    corrupt.mkdir()
+    (corrupt / "state.json").write_text("{not json")
+    old = service.storage_dir / "old"
+    old.mkdir()
+    (old / "state.json").write_text('{"id": "old", "name": "Old"}')
+
+    listed = ProjectStateService(str(service.storage_dir)).list_projects()
+    by_id = {p["id"]: p for p in listed}
+    assert set(by_id) == {project.id, "old"}
+    assert by_id["old"]["updated_at"] is None
+
+
+async def test_write_behind_coalesces_and_serves_pending(service):
+    project = service.create_project("Buffered", "q")
+    service.start_write_behind(interval=60)
+    try:
+        writes = []
+        save = service.save_project
+        service.save_project = lambda p: (writes.append(p.id), save(p))
+
+        project.name = "v2"
+        service.enqueue_save(project)
+        project = project.model_copy()
+        project.name = "v3"
+        service.enqueue_save(project)
+
+        # Not on disk yet, but loads see the pending copy
+        assert writes == []
+        assert service.load_project(project.id).name == "v3"
+
+        await service.flush()
+        assert writes == [project.id]
+    finally:
+        await service.stop_write_behind()
+
+    reopened = ProjectStateService(str(service.storage_dir))
+    assert reopened.load_project(project.id).name == "v3"
+
+
+async def test_stop_write_behind_flushes_pending(service):
+    project = service.create_project("Pending", "q")
+    service.start_write_behind(interval=60)
+    project.name = "saved on stop"
+    service.enqueue_save(project)
+    await service.stop_write_behind()
+
+    reopened = ProjectStateService(str(service.storage_dir))
+    assert reopened.load_project(project.id).name == "saved on stop"
+
+
+async def test_delete_during_flush_does_not_resurrect_project(service):
+    project = service.create_project("Doomed", "q")
+    service.start_write_behind(interval=60)
+    try:
+        project.name = "in flight"
+        service.enqueue_save(project)
+        flushing = asyncio.ensure_future(service.flush())
+        await asyncio.sleep(0)
+        assert project.id in service._inflight
+
+        assert service.delete_project(project.id)
+        await flushing
+    finally:
+        await service.stop_write_behind()
+
+    assert not service._get_project_dir(project.id).exists()
+    assert service.load_project(project.id) is None
+    assert service.list_projects() == []
+    # The tombstone is dropped once no flush can still hold the project
+    assert service._deleted == set()
+
+
+def test_checkpoints_are_gzip_compressed(service):
+    project = service.create_project("Checkpointed", "q")
+    service.create_checkpoint(project.id, "before")
+
+    checkpoint = service._get_checkpoint_file(project.id, "before")
+    assert checkpoint.name == "before.json.gz"
+    assert gzip.decompress(checkpoint.read_bytes()).startswith(b"{")
+
+    project.name = "after"
+    service.save_project(project)
+    restored = service.restore_checkpoint(project.id, "before")
+    assert restored.name == "Checkpointed"
+    assert service.load_project(project.id).name == "Checkpointed"
+
+
+def test_restore_legacy_json_checkpoint(service):
+    project = service.create_project("Legacy", "q")
+    legacy = service._get_checkpoint_file(project.id, "old").with_suffix("")
+    legacy.write_bytes(service._get_state_file(project.id).read_bytes())
+    service.create_checkpoint(project.id, "new")
+
+    assert service.list_checkpoints(project.id) == ["new", "old"]
+    assert service.restore_checkpoint(project.id, "old").name == "Legacy"
+
+    with pytest.raises(ValueError):
+        service.restore_checkpoint(project.id, "missing")
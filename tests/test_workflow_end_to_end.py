@@ -72,3 +72,13 @@ async def test_full_workflow_offline_smoke():
     
     # Final audit/log sanity
     assert project.audit_log, "Audit trail should capture steps across modules"
+
+
+def test_build_workflow_has_no_duplicate_edges():
+    """Each graph variant wires every edge once (duplicates re-run nodes)."""
+    from copilot_workflow.workflow import build_workflow
+    
+    for options in ({}, {"parallel_stages": True}, {"fuse_stages": True}):
+        graph = build_workflow(**options)
+        edges = [(start, end) for start, targets in graph.edges.items() for end, _ in targets]
+        assert len(edges) == len(set(edges)), f"duplicate edge in {options or 'default'} graph"